@@ -0,0 +1,183 @@
+# benchmarks/benchmark_pipeline.py
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import data_handling.data_loader as data_loader
+from data_handling.database_setup import setup_synthetic_database
+
+
+def time_stage(stage, repeat=1):
+    """
+    Times a stage and measures its peak Python memory.
+    The timing runs are done without tracemalloc so it doesn't slow them down;
+    one extra run is traced for the memory peak.
+    :return: A dict with the mean seconds per call, calls per second and peak memory.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            stage()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "calls": repeat,
+        "seconds_per_call": elapsed / repeat,
+        "calls_per_second": repeat / elapsed if elapsed > 0 else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def git_revision():
+    """Returns the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(nurses=25, weeks=2, shift_types=None, availability_density=0.7,
+                  population_size=20, generations=30, evaluations=200, seed=0):
+    """
+    Generates a synthetic instance in a temporary database and times each stage
+    of the scheduling pipeline on it.
+    :return: A JSON-serialisable dict with the instance, per-stage results and a
+             best-fitness-over-time trace of a short GA run.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "benchmark.db")
+        setup_synthetic_database(db_path, nurses=nurses, weeks=weeks, shift_types=shift_types,
+                                 availability_density=availability_density, seed=seed)
+        data_loader.DB_PATH = db_path
+        data_loader.invalidate_cache()
+
+        # Imported after DB_PATH is set: greedy_initialization loads data on import
+        import scheduling_algorithms.genetic_algorithm as ga
+        from scheduling_algorithms.greedy_initialization import greedy_initialization
+        from scheduling_algorithms.constructive_heuristic import constructive_initialization
+        from evaluation.fitness_function import evaluate_genome
+        from models.genome import load_tables
+
+        random.seed(seed)
+        ga.POPULATION_SIZE = population_size
+        stages = {}
+
+        def load_cold():
+            data_loader.invalidate_cache()
+            return load_tables()
+
+        stages["data_loading_cold"] = time_stage(load_cold, repeat=5)
+        stages["data_loading_cached"] = time_stage(load_tables, repeat=20)
+        tables = load_tables()
+
+        nurse_rows, shift_rows = list(tables.nurses), list(tables.shifts)
+        stages["greedy_initialization"] = time_stage(lambda: greedy_initialization(nurse_rows, shift_rows))
+        stages["constructive_initialization"] = time_stage(lambda: constructive_initialization(tables), repeat=5)
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            population = ga.initialize_population(tables)
+
+        genomes = iter(population * (evaluations // len(population) + 1))
+        stages["evaluate_genome"] = time_stage(lambda: evaluate_genome(next(genomes), tables), repeat=evaluations)
+        stages["evaluate_genome"]["evaluations_per_second"] = stages["evaluate_genome"]["calls_per_second"]
+
+        try:
+            from evaluation.vectorized_fitness import VectorizedEvaluator
+            batch_evaluator = VectorizedEvaluator(tables)
+        except ImportError:
+            batch_evaluator = None
+        if batch_evaluator is not None:
+            result = time_stage(lambda: batch_evaluator(population), repeat=max(1, evaluations // len(population)))
+            result["evaluations_per_second"] = result["calls_per_second"] * len(population)
+            stages["evaluate_population_numpy"] = result
+
+        stages["crossover"] = time_stage(
+            lambda: ga.crossover(random.choice(population), random.choice(population), tables), repeat=evaluations
+        )
+        stages["mutate"] = time_stage(lambda: ga.mutate(random.choice(population)[:], tables), repeat=evaluations)
+        stages["genetic_algorithm_generation"] = time_stage(
+            lambda: ga.evolve_generation(population, tables), repeat=max(1, generations // 3)
+        )
+
+        # Best fitness against wall time over a short GA run
+        convergence = []
+        start = time.perf_counter()
+        best_fitness = float("-inf")
+        for generation in range(generations):
+            population_scores = ga.evolve_generation(population, tables)
+            population = [genome for genome, _ in population_scores]
+            best_fitness = max(best_fitness, max(score for _, score in population_scores))
+            convergence.append({
+                "generation": generation + 1,
+                "seconds": time.perf_counter() - start,
+                "best_fitness": best_fitness,
+            })
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": sys.version.split()[0],
+        "instance": {
+            "nurses": nurses,
+            "weeks": weeks,
+            "shifts": tables.num_shifts,
+            "shift_types": shift_types or ["Morning", "Afternoon", "Night"],
+            "availability_density": availability_density,
+            "population_size": population_size,
+            "seed": seed,
+        },
+        "stages": stages,
+        "convergence": convergence,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the nurse scheduling pipeline on a synthetic instance.")
+    parser.add_argument("--nurses", type=int, default=25)
+    parser.add_argument("--weeks", type=int, default=2)
+    parser.add_argument("--shift-types", nargs="+", choices=["Morning", "Afternoon", "Night"])
+    parser.add_argument("--density", type=float, default=0.7, help="Chance a nurse is available on a weekday")
+    parser.add_argument("--population", type=int, default=20)
+    parser.add_argument("--generations", type=int, default=30)
+    parser.add_argument("--evaluations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        nurses=args.nurses, weeks=args.weeks, shift_types=args.shift_types,
+        availability_density=args.density, population_size=args.population,
+        generations=args.generations, evaluations=args.evaluations, seed=args.seed
+    )
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_json)
+        print(f"✅ Benchmark report written to {args.output}")
+    else:
+        print(report_json)
+
+
+if __name__ == "__main__":
+    main()
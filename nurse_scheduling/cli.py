@@ -0,0 +1,125 @@
+import argparse
+import json
+import sys
+import os
+import time
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import data_handling.data_loader as data_loader
+
+
+def schedule_report(schedule, fitness, seconds, seed, preference_bound=None):
+    """
+    Returns the result of a run as a JSON-serialisable dict.
+    :param preference_bound: Optional upper bound on the preference reward (see warm_start.py).
+    """
+    nurse_names = {nurse.nurse_id: nurse.name for nurse in schedule.nurses}
+    assignments = sorted(
+        (
+            {
+                "shift_id": shift.shift_id,
+                "date": shift.date,
+                "shift_type": shift.shift_type,
+                "nurse_id": nurse_id,
+                "nurse_name": nurse_names.get(nurse_id),
+            }
+            for nurse_id, shifts in schedule.assignments.items()
+            for shift in shifts
+        ),
+        key=lambda row: (row["date"], row["shift_id"])
+    )
+    return {
+        "fitness": fitness,
+        "seconds": seconds,
+        "seed": seed,
+        "preference_bound": preference_bound,
+        "shifts": len(schedule.shifts),
+        "unassigned_shifts": len(schedule.shifts) - len({row["shift_id"] for row in assignments}),
+        "assignments": assignments,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve the nurse schedule without the GUI.")
+    parser.add_argument("--db", help="SQLite database (default: $NURSE_SCHEDULE_DB or nurse_schedule.db next to the project)")
+    parser.add_argument("--setup", action="store_true", help="Recreate the sample database before solving")
+    parser.add_argument("--seed", type=int, help="Random seed for a reproducible run")
+    parser.add_argument("--population", type=int, help="Population size")
+    parser.add_argument("--generations", type=int, help="Generation limit (default: none when --time-budget is set)")
+    parser.add_argument("--time-budget", type=float, help="Stop after this many seconds and keep the best schedule so far")
+    parser.add_argument("--seeding", choices=("constructive", "matching"), default="constructive",
+                        help="Initial population: heuristic + random genomes, or the min-cost matching warm start")
+    parser.add_argument("--operators", choices=("classic", "uniform", "week_block"), default="classic",
+                        help="Crossover/mutation pair; uniform and week_block only move shifts to available nurses")
+    parser.add_argument("--repair", action="store_true", help="Repair every child so each shift has one nurse who can take it")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to evaluate the population")
+    parser.add_argument("--output", help="Write the schedule as JSON here instead of stdout")
+    parser.add_argument("--csv", help="Also write the assignments as CSV here")
+    parser.add_argument("--parquet", help="Also write the assignments as Parquet here (needs pyarrow)")
+    parser.add_argument("--ics", metavar="DIR", help="Also write one .ics calendar per nurse into this directory")
+    parser.add_argument("--save-version", help="Also save the schedule in the database under this name")
+    parser.add_argument("--load-version", help="Report (and export) a saved schedule version instead of solving")
+    parser.add_argument("--quiet", action="store_true", help="Only print errors")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.db:
+        data_loader.set_db_path(os.path.abspath(args.db))
+    if not args.setup and not os.path.exists(data_loader.DB_PATH):
+        parser.error(f"Database not found: {data_loader.DB_PATH} (use --setup to create it)")
+    if args.setup and args.load_version:
+        parser.error("--setup drops the saved schedule versions, so it cannot be combined with --load-version")
+
+    # Imported after the database path is set
+    from data_handling.database_setup import setup_database
+    from data_handling.exporters import export_csv, export_ics, export_parquet
+    from data_handling.schedule_store import load_schedule, save_schedule
+    from evaluation.fitness_function import evaluate_schedule
+    from scheduling_algorithms.genetic_algorithm import genetic_algorithm
+    from scheduling_algorithms.warm_start import preference_bound
+    from models.genome import load_tables
+
+    if args.setup:
+        setup_database()
+        data_loader.invalidate_cache()
+
+    if args.load_version:
+        try:
+            schedule = load_schedule(args.load_version)
+        except KeyError as e:
+            parser.error(e.args[0])
+    else:
+        schedule = genetic_algorithm(
+            workers=args.workers, seed=args.seed, population_size=args.population,
+            generations=args.generations, time_budget=args.time_budget, verbose=not args.quiet,
+            seeding=args.seeding, operators=args.operators, repair_children=args.repair
+        )
+    fitness = evaluate_schedule(schedule)
+
+    if args.save_version:
+        save_schedule(schedule, name=args.save_version, fitness=fitness)
+    if args.csv:
+        export_csv(schedule, args.csv)
+    if args.parquet:
+        export_parquet(schedule, args.parquet)
+    if args.ics:
+        export_ics(schedule, args.ics)
+
+    seconds = time.perf_counter() - start
+    # The matching warm start also reports how much preference reward is reachable at most
+    bound = preference_bound(load_tables()) if args.seeding == "matching" and not args.load_version else None
+    report_json = json.dumps(schedule_report(schedule, fitness, seconds, args.seed, bound), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_json)
+        if not args.quiet:
+            print(f"✅ Schedule written to {args.output} (fitness {fitness})")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# constraints/compiled_model.py
+
+import bisect
+import sys
+import os
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from constraints.constraints import (
+    MAX_HOURS_PER_WEEK,
+    MAX_CONSECUTIVE_SHIFTS,
+    MIN_HOURS_BETWEEN_SHIFTS,
+    check_timeline
+)
+from models.genome import UNASSIGNED
+
+
+class NurseTimeline:
+    """
+    One nurse's shifts kept sorted by start hour, with running weekly hours and
+    worked days, built from the compiled shifts in a ScheduleTables.
+
+    check() answers all three hard constraints in one linear sweep, and
+    can_insert() tells whether one more shift keeps them satisfied in O(log n).
+    """
+
+    def __init__(self, tables, shift_indices=()):
+        """
+        :param tables: The shared ScheduleTables.
+        :param shift_indices: The nurse's current shift indices, in any order.
+        """
+        self.tables = tables
+        self.starts = []  # Sorted start hours
+        self.shift_indices = []  # Shift index at the same position as each start
+        self.hours = 0
+        self.weekly_hours = {}
+        self.day_counts = {}  # Day ordinal -> shifts worked that day
+        for shift_idx in shift_indices:
+            self.add(shift_idx)
+
+    def add(self, shift_idx):
+        """Inserts a shift at its place in the timeline."""
+        start, end, week, day = self.tables.shift_timeline[shift_idx]
+        position = bisect.bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.shift_indices.insert(position, shift_idx)
+
+        self.hours += end - start
+        self.weekly_hours[week] = self.weekly_hours.get(week, 0) + end - start
+        self.day_counts[day] = self.day_counts.get(day, 0) + 1
+
+    def remove(self, shift_idx):
+        """Removes a shift from the timeline. Raises ValueError if the nurse doesn't work it."""
+        start, end, week, day = self.tables.shift_timeline[shift_idx]
+        position = bisect.bisect_left(self.starts, start)
+        while position < len(self.starts) and self.starts[position] == start:
+            if self.shift_indices[position] == shift_idx:
+                break
+            position += 1
+        else:
+            raise ValueError(f"Shift {self.tables.shift_ids[shift_idx]} is not in this timeline.")
+        del self.starts[position]
+        del self.shift_indices[position]
+
+        self.hours -= end - start
+        self.weekly_hours[week] -= end - start
+        self.day_counts[day] -= 1
+        if not self.day_counts[day]:
+            del self.day_counts[day]
+
+    def check(self):
+        """
+        Checks the whole timeline.
+        :return: (max hours ok, consecutive shifts ok, rest period ok).
+        """
+        timeline = self.tables.shift_timeline
+        return check_timeline([timeline[shift_idx] for shift_idx in self.shift_indices])
+
+    def can_insert(self, shift_idx):
+        """
+        Tells whether adding the shift keeps the weekly hours, rest period and
+        consecutive days limits, assuming the current timeline keeps them.
+        Only the shift's week, its neighbours in the timeline and the run of
+        worked days around it are looked at.
+        """
+        start, end, week, day = self.tables.shift_timeline[shift_idx]
+        if self.weekly_hours.get(week, 0) + end - start > MAX_HOURS_PER_WEEK:
+            return False
+
+        position = bisect.bisect_right(self.starts, start)
+        if position > 0:
+            previous_end = self.tables.shift_ends[self.shift_indices[position - 1]]
+            if start - previous_end < MIN_HOURS_BETWEEN_SHIFTS:
+                return False
+        if position < len(self.starts) and self.starts[position] - end < MIN_HOURS_BETWEEN_SHIFTS:
+            return False
+
+        if day in self.day_counts:
+            return True  # Already a worked day, so no run gets longer
+
+        # Length of the run of worked days this shift would join
+        before = 0
+        while before < MAX_CONSECUTIVE_SHIFTS and day - before - 1 in self.day_counts:
+            before += 1
+        after = 0
+        while before + after < MAX_CONSECUTIVE_SHIFTS and day + after + 1 in self.day_counts:
+            after += 1
+        return before + after + 1 <= MAX_CONSECUTIVE_SHIFTS
+
+    def __len__(self):
+        return len(self.shift_indices)
+
+    def __iter__(self):
+        return iter(self.shift_indices)
+
+
+def build_timelines(genome, tables):
+    """Returns one NurseTimeline per nurse for a genome."""
+    timelines = [NurseTimeline(tables) for _ in range(tables.num_nurses)]
+    for shift_idx, nurse_idx in enumerate(genome):
+        if nurse_idx != UNASSIGNED:
+            timelines[nurse_idx].add(shift_idx)
+    return timelines
@@ -10,70 +10,99 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from models.nurse import Nurse
 from models.shift import Shift
 from models.schedule import Schedule
-from datetime import datetime, timedelta
+from models.availability import is_available_for
+from datetime import datetime
+from functools import lru_cache
 
 # NHS Policies (These can be adjusted based on real-world rules)
 MAX_HOURS_PER_WEEK = 48  # NHS Working Time Directive
 MAX_CONSECUTIVE_SHIFTS = 6  # Prevent burnout
 MIN_HOURS_BETWEEN_SHIFTS = 11  # Minimum rest period between shifts
 SHIFT_HOURS = {"Morning": 8, "Afternoon": 8, "Night": 10}  # Typical shift durations
+SHIFT_START_HOURS = {"Morning": 6, "Afternoon": 14, "Night": 22}  # Hour of the day each shift starts
 
 def is_nurse_available(nurse: Nurse, shift: Shift) -> bool:
     """Check if a nurse is available for the given shift."""
-    available_days = nurse.availability.split(", ")
-    shift_day = datetime.strptime(shift.date, "%Y-%m-%d").strftime("%a")  # Extract day of the week
-    return any(shift_day in slot for slot in available_days)
+    return is_available_for(nurse.availability, shift.date, shift.shift_type)
 
-def check_max_hours(nurse: Nurse, schedule: Schedule) -> bool:
+@lru_cache(maxsize=None)
+def compile_shift(date: str, shift_type: str) -> tuple:
     """
-    Ensure the nurse does not exceed the maximum working hours per week.
+    Converts a shift into integers once, so checks never parse dates again.
+    :return: (start hour, end hour, ISO week, day ordinal), with hours counted from 0001-01-01.
+    """
+    shift_date = datetime.strptime(date, "%Y-%m-%d")
+    day = shift_date.toordinal()
+    start = day * 24 + SHIFT_START_HOURS.get(shift_type, 0)
+    return start, start + SHIFT_HOURS.get(shift_type, 0), shift_date.isocalendar()[1], day
+
+def check_timeline(timeline) -> tuple:
+    """
+    Answers the three hard checks for one nurse in a single pass.
+    :param timeline: The nurse's compiled shifts, sorted by start hour.
+    :return: (max hours ok, consecutive shifts ok, rest period ok).
     """
     weekly_hours = {}
+    max_hours_ok = consecutive_ok = rest_ok = True
+    prev_end = prev_day = None
+    consecutive_count = 0
+
+    for start, end, week, day in timeline:
+        hours = weekly_hours[week] = weekly_hours.get(week, 0) + end - start
+        if hours > MAX_HOURS_PER_WEEK:
+            max_hours_ok = False
+
+        if prev_end is not None and start - prev_end < MIN_HOURS_BETWEEN_SHIFTS:
+            rest_ok = False
+        prev_end = end
+
+        # Distinct days only: a second shift on the same day is a rest period problem, not a new run
+        if day != prev_day:
+            consecutive_count = consecutive_count + 1 if prev_day is not None and day - prev_day == 1 else 1
+            if consecutive_count > MAX_CONSECUTIVE_SHIFTS:
+                consecutive_ok = False
+            prev_day = day
 
-    # Sort shifts by date before calculating hours
-    assigned_shifts = sorted(schedule.assignments.get(nurse.nurse_id, []), key=lambda s: s.date)
+    return max_hours_ok, consecutive_ok, rest_ok
 
-    for shift in assigned_shifts:
-        shift_week = datetime.strptime(shift.date, "%Y-%m-%d").isocalendar()[1]  # Get ISO week number
-        weekly_hours.setdefault(shift_week, 0)
-        weekly_hours[shift_week] += SHIFT_HOURS.get(shift.shift_type, 0)  # Default to 0 if shift type is invalid
+def nurse_timeline(nurse: Nurse, schedule: Schedule) -> list:
+    """Returns the nurse's compiled shifts sorted by start hour."""
+    return sorted(compile_shift(shift.date, shift.shift_type) for shift in schedule.assignments.get(nurse.nurse_id, []))
 
-    return all(hours <= MAX_HOURS_PER_WEEK for hours in weekly_hours.values())
+def check_nurse_constraints(nurse: Nurse, schedule: Schedule) -> tuple:
+    """
+    Runs the max hours, consecutive shifts and rest period checks together.
+    :return: (max hours ok, consecutive shifts ok, rest period ok).
+    """
+    return check_timeline(nurse_timeline(nurse, schedule))
+
+def check_max_hours(nurse: Nurse, schedule: Schedule) -> bool:
+    """
+    Ensure the nurse does not exceed the maximum working hours per week.
+    """
+    return check_nurse_constraints(nurse, schedule)[0]
 
 def check_consecutive_shifts(nurse: Nurse, schedule: Schedule) -> bool:
     """
     Ensure nurses do not work more than MAX_CONSECUTIVE_SHIFTS days in a row.
     """
-    assigned_dates = sorted([datetime.strptime(shift.date, "%Y-%m-%d") for shift in schedule.assignments.get(nurse.nurse_id, [])])
-    consecutive_count = 1
-
-    for i in range(1, len(assigned_dates)):
-        if (assigned_dates[i] - assigned_dates[i - 1]).days == 1:
-            consecutive_count += 1
-            if consecutive_count > MAX_CONSECUTIVE_SHIFTS:
-                return False
-        else:
-            consecutive_count = 1  # Reset counter if a day is skipped
-
-    return True
+    return check_nurse_constraints(nurse, schedule)[1]
 
 def check_rest_period(nurse: Nurse, schedule: Schedule) -> bool:
     """
-    Ensure nurses have at least MIN_HOURS_BETWEEN_SHIFTS rest.
+    Ensure nurses have at least MIN_HOURS_BETWEEN_SHIFTS rest between the end of
+    one shift and the start of the next.
     """
-    assigned_shifts = sorted(schedule.assignments.get(nurse.nurse_id, []), key=lambda s: s.date)
-
-    for i in range(1, len(assigned_shifts)):
-        prev_shift = assigned_shifts[i - 1]
-        curr_shift = assigned_shifts[i]
+    return check_nurse_constraints(nurse, schedule)[2]
 
-        prev_end_time = datetime.strptime(prev_shift.date, "%Y-%m-%d") + timedelta(hours=SHIFT_HOURS.get(prev_shift.shift_type, 0))
-        curr_start_time = datetime.strptime(curr_shift.date, "%Y-%m-%d")
-
-        if (curr_start_time - prev_end_time).total_seconds() / 3600 < MIN_HOURS_BETWEEN_SHIFTS:
-            return False  # Rest period violation
-
-    return True
+def check_genome_constraints(shift_indices, tables) -> tuple:
+    """
+    Genome version of check_nurse_constraints.
+    :param shift_indices: The nurse's shift indices in the genome.
+    :param tables: The shared ScheduleTables.
+    :return: (max hours ok, consecutive shifts ok, rest period ok).
+    """
+    return check_timeline(sorted(tables.shift_timeline[shift_idx] for shift_idx in shift_indices))
 
 def check_shift_coverage(schedule: Schedule) -> bool:
     """
@@ -97,10 +126,6 @@ def validate_schedule(schedule: Schedule) -> bool:
     """
     Run all hard constraint checks on the schedule.
     """
-    for nurse in schedule.nurses:
-        if (not check_max_hours(nurse, schedule) or
-            not check_consecutive_shifts(nurse, schedule) or
-            not check_rest_period(nurse, schedule) or
-            not check_shift_coverage(schedule)):
-            return False
-    return True
\ No newline at end of file
+    if not check_shift_coverage(schedule):
+        return False
+    return all(all(check_nurse_constraints(nurse, schedule)) for nurse in schedule.nurses)
\ No newline at end of file
@@ -1,9 +1,76 @@
+import os
 import sqlite3
+from collections import namedtuple
 
-DB_PATH = "C:\\Users\\elmaw\\OneDrive\\Documents\\nurse_scheduling\\nurse_schedule.db"
+# Set NURSE_SCHEDULE_DB to use another database; the default is the one next to the project
+DB_PATH = os.environ.get(
+    "NURSE_SCHEDULE_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nurse_schedule.db")
+)
 
+_snapshot = None  # Cached DataSnapshot, reloaded when the database changes
+_watch_connection = None  # Kept open so PRAGMA data_version can see commits from other connections
+_watch_path = None
+_cache_stats = {"hits": 0, "misses": 0}
 
-def fetch_nurses():
+NURSE_COLUMNS = ("nurse_id", "name", "age", "availability", "preferred_shifts")
+SHIFT_COLUMNS = ("shift_id", "date", "shift_type", "assigned_nurse", "ward")
+NurseRow = namedtuple("NurseRow", NURSE_COLUMNS)
+ShiftRow = namedtuple("ShiftRow", SHIFT_COLUMNS)
+ROW_TYPES = ("dict", "tuple", "namedtuple")
+FETCH_SIZE = 500  # Rows pulled from SQLite per fetchmany() call
+
+
+class FrozenRow(dict):
+    """A read-only dict, so cached rows can be shared between callers safely."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Cached database rows are read-only; copy them with dict(row) first.")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenRow, (dict(self),))
+
+
+class DataSnapshot:
+    """Immutable, id-indexed copy of the nurses and shifts tables."""
+
+    def __init__(self, nurses, shifts, signature):
+        self.nurses = tuple(FrozenRow(nurse) for nurse in nurses)
+        self.shifts = tuple(FrozenRow(shift) for shift in shifts)
+        self.nurses_by_id = {nurse["nurse_id"]: nurse for nurse in self.nurses}
+        self.shifts_by_id = {shift["shift_id"]: shift for shift in self.shifts}
+        self.signature = signature
+
+    def __repr__(self):
+        return f"DataSnapshot with {len(self.nurses)} nurses and {len(self.shifts)} shifts"
+
+
+def _database_signature():
+    """
+    Returns a value that changes whenever the database does: the file's
+    mtime and size plus SQLite's data_version for commits not yet checkpointed.
+    """
+    global _watch_connection, _watch_path
+
+    if _watch_path != DB_PATH:
+        if _watch_connection is not None:
+            _watch_connection.close()
+        _watch_connection = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _watch_path = DB_PATH
+
+    try:
+        stat = os.stat(DB_PATH)
+        file_state = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_state = None
+
+    data_version = _watch_connection.execute("PRAGMA data_version;").fetchone()[0]
+    return (DB_PATH, file_state, data_version)
+
+
+def _query_nurses():
     """Loads nurse data from the database and returns a list of dictionaries."""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -24,12 +91,17 @@ def fetch_nurses():
         for row in nurses
     ]
 
-def fetch_shifts():
+def _has_ward_column(conn):
+    """Older databases were created before shifts had a ward column."""
+    return any(column[1] == "ward" for column in conn.execute("PRAGMA table_info(shifts);"))
+
+def _query_shifts():
     """Loads shift data from the database and returns a list of dictionaries."""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
-    cursor.execute("SELECT shift_id, date, shift_type, assigned_nurse FROM shifts;")
+    ward = "ward" if _has_ward_column(conn) else "NULL"
+    cursor.execute(f"SELECT shift_id, date, shift_type, assigned_nurse, {ward} FROM shifts;")
     shifts = cursor.fetchall()
     
     conn.close()
@@ -39,11 +111,134 @@ def fetch_shifts():
             "shift_id": row[0],
             "date": row[1],
             "shift_type": row[2],
-            "assigned_nurse": row[3]  # Will be None if not assigned
+            "assigned_nurse": row[3],  # Will be None if not assigned
+            "ward": row[4]
         }
         for row in shifts
     ]
 
+def _row_factory(row_type, columns, namedtuple_class):
+    """Returns a function turning a raw SQLite tuple into the requested row type."""
+    if row_type not in ROW_TYPES:
+        raise ValueError(f"Unknown row type '{row_type}'. Choose from {ROW_TYPES}.")
+    if row_type == "tuple":
+        return None  # SQLite's own tuples, no conversion at all
+    if row_type == "namedtuple":
+        return namedtuple_class._make
+    return lambda row: dict(zip(columns, row))
+
+def _stream(query, params, factory, fetch_size):
+    """Runs a query and yields its rows in fetch_size batches, closing the connection at the end."""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        cursor = conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            if factory is None:
+                yield from rows
+            else:
+                for row in rows:
+                    yield factory(row)
+    finally:
+        conn.close()
+
+def iter_shifts(start_date=None, end_date=None, wards=None, shift_types=None,
+                row_type="dict", fetch_size=FETCH_SIZE):
+    """
+    Streams the shifts in a planning window, filtered in SQL so only the
+    matching rows are read. Rows come in date order.
+    :param start_date: First date to include ("YYYY-MM-DD"), or None.
+    :param end_date: Last date to include ("YYYY-MM-DD"), or None.
+    :param wards: Wards to include, or None for all.
+    :param shift_types: Shift types to include, or None for all.
+    :param row_type: "dict", "tuple" or "namedtuple" (ShiftRow); tuples follow SHIFT_COLUMNS.
+    :param fetch_size: Rows fetched from SQLite at a time.
+    """
+    factory = _row_factory(row_type, SHIFT_COLUMNS, ShiftRow)
+
+    conn = sqlite3.connect(DB_PATH)
+    has_ward = _has_ward_column(conn)
+    conn.close()
+
+    conditions, params = [], []
+    if start_date is not None:
+        conditions.append("date >= ?")
+        params.append(start_date)
+    if end_date is not None:
+        conditions.append("date <= ?")
+        params.append(end_date)
+    if wards is not None:
+        if not has_ward:
+            raise ValueError("This database's shifts have no ward column.")
+        wards = list(wards)
+        conditions.append(f"ward IN ({', '.join('?' * len(wards))})")
+        params.extend(wards)
+    if shift_types is not None:
+        shift_types = list(shift_types)
+        conditions.append(f"shift_type IN ({', '.join('?' * len(shift_types))})")
+        params.extend(shift_types)
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    ward = "ward" if has_ward else "NULL"
+    query = f"SELECT shift_id, date, shift_type, assigned_nurse, {ward} FROM shifts{where} ORDER BY date, shift_id;"
+    return _stream(query, params, factory, fetch_size)
+
+def iter_nurses(nurse_ids=None, row_type="dict", fetch_size=FETCH_SIZE):
+    """
+    Streams the nurses, optionally only the given IDs.
+    :param row_type: "dict", "tuple" or "namedtuple" (NurseRow); tuples follow NURSE_COLUMNS.
+    """
+    factory = _row_factory(row_type, NURSE_COLUMNS, NurseRow)
+
+    query = "SELECT nurse_id, name, age, availability, preferred_shifts FROM nurses"
+    params = []
+    if nurse_ids is not None:
+        nurse_ids = list(nurse_ids)
+        query += f" WHERE nurse_id IN ({', '.join('?' * len(nurse_ids))})"
+        params.extend(nurse_ids)
+    return _stream(query + " ORDER BY nurse_id;", params, factory, fetch_size)
+
+def load_snapshot():
+    """
+    Returns the cached DataSnapshot, reloading it only if the database has changed
+    since it was taken (or after invalidate_cache()).
+    """
+    global _snapshot
+
+    signature = _database_signature()
+    if _snapshot is not None and _snapshot.signature == signature:
+        _cache_stats["hits"] += 1
+        return _snapshot
+
+    _cache_stats["misses"] += 1
+    _snapshot = DataSnapshot(_query_nurses(), _query_shifts(), signature)
+    return _snapshot
+
+def set_db_path(path):
+    """Points every loader at another database and drops the cached snapshot."""
+    global DB_PATH
+    DB_PATH = path
+    invalidate_cache()
+
+def invalidate_cache():
+    """Drops the cached snapshot so the next read goes to the database."""
+    global _snapshot
+    _snapshot = None
+
+def get_cache_stats():
+    """Returns the snapshot cache hit and miss counters."""
+    return dict(_cache_stats)
+
+def fetch_nurses():
+    """Returns the nurses as a list of read-only dictionaries, served from the snapshot cache."""
+    return list(load_snapshot().nurses)
+
+def fetch_shifts():
+    """Returns the shifts as a list of read-only dictionaries, served from the snapshot cache."""
+    return list(load_snapshot().shifts)
+
 if __name__ == "__main__":
     # Test loading data
     nurses = fetch_nurses()
@@ -1,18 +1,28 @@
 # data_handling/database_setup.py
 
 import sqlite3
+import sys
+import os
 from datetime import datetime, timedelta
 import random
 
-def setup_database():
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import data_handling.data_loader as data_loader
+
+SHIFT_TYPES = ["Morning", "Afternoon", "Night"]
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+def create_tables(cursor):
     """
-    Sets up the database by creating tables and inserting sample data.
+    Drops and recreates the nurses and shifts tables.
+    Saved schedule versions are dropped too: the new shifts restart their IDs,
+    so stored assignments would silently point at different shifts.
     """
-    # Create the database and connect
-    conn = sqlite3.connect("nurse_schedule.db")
-    cursor = conn.cursor()
-
     # Drop existing tables if they exist (for testing purposes)
+    cursor.execute("DROP TABLE IF EXISTS schedule_assignments;")
+    cursor.execute("DROP TABLE IF EXISTS schedule_versions;")
     cursor.execute("DROP TABLE IF EXISTS nurses;")
     cursor.execute("DROP TABLE IF EXISTS shifts;")
 
@@ -34,10 +44,28 @@ def setup_database():
         date TEXT NOT NULL,
         shift_type TEXT NOT NULL CHECK(shift_type IN ('Morning', 'Afternoon', 'Night')),
         assigned_nurse INTEGER,
+        ward TEXT NOT NULL DEFAULT 'General',
         FOREIGN KEY (assigned_nurse) REFERENCES nurses(nurse_id)
     );
     """)
 
+    # Loaders filter the planning window and wards in SQL
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_date ON shifts(date);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_ward_date ON shifts(ward, date);")
+
+def setup_database(start_date=datetime(2025, 2, 19), weeks=2, db_path=None):
+    """
+    Sets up the database by creating tables and inserting sample data.
+    :param start_date: First day of the planning horizon.
+    :param weeks: Length of the planning horizon in weeks.
+    :param db_path: Database to create (default: data_loader.DB_PATH).
+    """
+    # Create the database and connect
+    conn = sqlite3.connect(db_path or data_loader.DB_PATH)
+    cursor = conn.cursor()
+
+    create_tables(cursor)
+
     # Sample nurse data (adjusted for schema)
     nurse_data = [
         ("Alice Johnson", 34, "Mon-Fri (Morning), Sat (Evening)", "Morning"),
@@ -70,13 +98,12 @@ def setup_database():
     # Insert nurse data into database
     cursor.executemany("INSERT INTO nurses (name, age, availability, preferred_shifts) VALUES (?, ?, ?, ?)", nurse_data)
 
-    # Function to generate two weeks of unassigned shifts
+    # Function to generate the horizon's unassigned shifts
     def insert_shift_data():
         shift_types = ["Morning", "Afternoon", "Night"]
-        start_date = datetime(2025, 2, 19)
         shifts = []
 
-        for day in range(14):  # Two weeks
+        for day in range(weeks * 7):
             date = start_date + timedelta(days=day)
             formatted_date = date.strftime("%Y-%m-%d")
             for shift in shift_types:
@@ -93,6 +120,51 @@ def setup_database():
 
     print("Database setup complete: Nurses and unassigned shifts added!")
 
+def setup_synthetic_database(db_path, nurses=25, weeks=2, shift_types=None,
+                             availability_density=0.7, start_date=datetime(2025, 2, 19), seed=None,
+                             wards=None):
+    """
+    Creates a database with a generated instance of any size, for benchmarks.
+    :param db_path: Where to write the SQLite database.
+    :param nurses: Number of nurses.
+    :param weeks: Length of the planning horizon in weeks.
+    :param shift_types: Shift types per day (default: Morning, Afternoon and Night).
+    :param availability_density: Chance that a nurse is available on a given weekday.
+    :param start_date: First day of the horizon.
+    :param seed: Optional random seed for reproducible instances.
+    :param wards: Ward names; every ward gets its own shifts (default: one "General" ward).
+    """
+    rng = random.Random(seed)
+    shift_types = shift_types or SHIFT_TYPES
+    wards = wards or ["General"]
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    create_tables(cursor)
+
+    nurse_data = []
+    for i in range(nurses):
+        # One "Day (Type)" group per available weekday, e.g. "Mon (Morning), Tue (Flexible)"
+        slots = [
+            f"{day} ({rng.choice(shift_types + ['Flexible'])})"
+            for day in WEEKDAYS if rng.random() < availability_density
+        ]
+        nurse_data.append((f"Nurse {i + 1}", rng.randint(22, 60), ", ".join(slots), rng.choice(shift_types)))
+
+    cursor.executemany("INSERT INTO nurses (name, age, availability, preferred_shifts) VALUES (?, ?, ?, ?)", nurse_data)
+
+    shift_data = []
+    for day in range(weeks * 7):
+        formatted_date = (start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+        for ward in wards:
+            for shift in shift_types:
+                shift_data.append((formatted_date, shift, None, ward))
+
+    cursor.executemany("INSERT INTO shifts (date, shift_type, assigned_nurse, ward) VALUES (?, ?, ?, ?)", shift_data)
+
+    conn.commit()
+    conn.close()
+
 # Allow the script to be run directly
 if __name__ == "__main__":
     setup_database()
\ No newline at end of file
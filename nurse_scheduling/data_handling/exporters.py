@@ -0,0 +1,186 @@
+# data_handling/exporters.py
+
+import csv
+import re
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from constraints.constraints import compile_shift
+
+EXPORT_COLUMNS = ("shift_id", "date", "shift_type", "ward", "nurse_id", "nurse_name", "start", "end", "hours")
+BATCH_SIZE = 65536  # Rows per Parquet/Arrow record batch
+
+
+@lru_cache(maxsize=None)
+def shift_times(date, shift_type):
+    """
+    Real start and end of a shift as naive local datetimes, cached per (date, shift type).
+    :return: (start, end, hours)
+    """
+    start_hour, end_hour, _, day = compile_shift(date, shift_type)
+    midnight = datetime.fromordinal(day)
+    return midnight + timedelta(hours=start_hour - day * 24), midnight + timedelta(hours=end_hour - day * 24), end_hour - start_hour
+
+
+def iter_assignments(schedule):
+    """
+    Yields one tuple per assignment, in EXPORT_COLUMNS order, straight from
+    schedule.assignments. Nurse names come from a dict built once, so each
+    row is O(1) however many nurses there are.
+    """
+    nurse_names = {nurse.nurse_id: nurse.name for nurse in schedule.nurses}
+    for nurse_id, shifts in schedule.assignments.items():
+        name = nurse_names.get(nurse_id)
+        for shift in shifts:
+            start, end, hours = shift_times(shift.date, shift.shift_type)
+            yield (shift.shift_id, shift.date, shift.shift_type, shift.ward, nurse_id, name,
+                   start.isoformat(), end.isoformat(), hours)
+
+
+def export_csv(schedule, path="nurse_schedule.csv"):
+    """
+    Streams every assignment to a CSV file with a header row.
+    :return: The number of assignments written.
+    """
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for row in iter_assignments(schedule):
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _arrow_schema():
+    return pa.schema([
+        ("shift_id", pa.int64()),
+        ("date", pa.string()),
+        ("shift_type", pa.string()),
+        ("ward", pa.string()),
+        ("nurse_id", pa.int64()),
+        ("nurse_name", pa.string()),
+        ("start", pa.string()),
+        ("end", pa.string()),
+        ("hours", pa.int32()),
+    ])
+
+
+def _record_batches(schedule, schema, batch_size):
+    """Yields the assignments as Arrow record batches of at most batch_size rows."""
+    rows = iter_assignments(schedule)
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            return
+        yield pa.RecordBatch.from_arrays([pa.array(column, type=field.type)
+                                          for column, field in zip(zip(*chunk), schema)], schema=schema)
+
+
+def export_parquet(schedule, path="nurse_schedule.parquet", batch_size=BATCH_SIZE):
+    """
+    Writes the assignments to a Parquet file one record batch at a time.
+    Needs pyarrow.
+    :return: The number of assignments written.
+    """
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow. Install it with 'pip install pyarrow'.")
+
+    schema = _arrow_schema()
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in _record_batches(schedule, schema, batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+def export_arrow(schedule, path="nurse_schedule.arrow", batch_size=BATCH_SIZE):
+    """
+    Writes the assignments to an Arrow IPC (Feather v2) file one record batch at a time.
+    Needs pyarrow.
+    :return: The number of assignments written.
+    """
+    if pa is None:
+        raise ImportError("Arrow export needs pyarrow. Install it with 'pip install pyarrow'.")
+
+    schema = _arrow_schema()
+    count = 0
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in _record_batches(schedule, schema, batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+def _ics_text(value):
+    """Escapes a value for an iCalendar TEXT property."""
+    return str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def calendar_filename(nurse_id, name):
+    """A safe file name for a nurse's calendar, e.g. (1, "Alice Johnson") -> "nurse_1_Alice_Johnson.ics"."""
+    return f"nurse_{nurse_id}_" + re.sub(r"[^A-Za-z0-9]+", "_", name or "").strip("_") + ".ics"
+
+
+def write_ics(f, nurse_id, name, shifts, stamp):
+    """Writes one nurse's shifts to an open file as an iCalendar (RFC 5545) calendar."""
+    f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Nurse Scheduling System//EN\r\n"
+            f"X-WR-CALNAME:{_ics_text(f'Shifts - {name}')}\r\n")
+    for shift in shifts:
+        start, end, _ = shift_times(shift.date, shift.shift_type)
+        summary = f"{shift.shift_type} shift" + (f" - {shift.ward}" if shift.ward else "")
+        f.write("BEGIN:VEVENT\r\n"
+                f"UID:shift-{shift.shift_id}-nurse-{nurse_id}@nurse-scheduling\r\n"
+                f"DTSTAMP:{stamp}\r\n"
+                f"DTSTART:{start:%Y%m%dT%H%M%S}\r\n"
+                f"DTEND:{end:%Y%m%dT%H%M%S}\r\n"
+                f"SUMMARY:{_ics_text(summary)}\r\n"
+                "END:VEVENT\r\n")
+    f.write("END:VCALENDAR\r\n")
+
+
+def export_ics(schedule, directory="calendars"):
+    """
+    Writes one .ics calendar per nurse with assignments. Times are floating
+    local times, so calendars show them as scheduled.
+    :return: The list of paths written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    nurse_names = {nurse.nurse_id: nurse.name for nurse in schedule.nurses}
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    paths = []
+
+    for nurse_id, shifts in schedule.assignments.items():
+        if not shifts:
+            continue
+        path = os.path.join(directory, calendar_filename(nurse_id, nurse_names.get(nurse_id)))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            write_ics(f, nurse_id, nurse_names.get(nurse_id, f"Nurse {nurse_id}"), shifts, stamp)
+        paths.append(path)
+
+    return paths
+
+
+if __name__ == "__main__":
+    from models.genome import load_tables, genome_to_schedule
+    from scheduling_algorithms.constructive_heuristic import constructive_initialization
+
+    tables = load_tables()
+    schedule = genome_to_schedule(constructive_initialization(tables), tables)
+    print(f"✅ {export_csv(schedule)} assignments exported to nurse_schedule.csv")
+    print(f"✅ {len(export_ics(schedule))} calendars exported to calendars/")
+    if pa is not None:
+        print(f"✅ {export_parquet(schedule)} assignments exported to nurse_schedule.parquet")
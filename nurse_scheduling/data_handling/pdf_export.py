@@ -0,0 +1,230 @@
+# data_handling/pdf_export.py
+
+import multiprocessing
+import queue
+import re
+import sys
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from constraints.constraints import SHIFT_HOURS
+
+PAGE_SIZE = letter
+MARGIN = 50
+ROW_HEIGHT = 18
+FONT = "Helvetica"
+FONT_SIZE = 10
+PROGRESS_EVERY = 200  # Rows between progress callbacks
+PARALLEL_ROSTER_MIN = 2000  # Fewer rosters are written serially: spawning workers costs more than it saves
+
+# (header, x offset from the left margin)
+SCHEDULE_COLUMNS = [("Shift ID", 0), ("Date", 70), ("Shift Type", 170), ("Ward", 270), ("Assigned Nurse", 370)]
+ROSTER_COLUMNS = [("Date", 0), ("Day", 100), ("Shift Type", 170), ("Ward", 270), ("Hours", 370)]
+
+
+def schedule_rows(schedule):
+    """
+    Returns one (shift ID, date, shift type, ward, nurse) row per assignment,
+    plus unassigned shifts, in shift ID order.
+    """
+    nurse_names = {nurse.nurse_id: nurse.name for nurse in schedule.nurses}
+    rows = []
+    covered = set()
+    for nurse_id, shifts in schedule.assignments.items():
+        label = f"{nurse_names.get(nurse_id, 'Nurse')} ({nurse_id})"
+        for shift in shifts:
+            rows.append((shift.shift_id, shift.date, shift.shift_type, shift.ward or "", label))
+            covered.add(shift.shift_id)
+    for shift in schedule.shifts:
+        if shift.shift_id not in covered:
+            rows.append((shift.shift_id, shift.date, shift.shift_type, shift.ward or "", "Unassigned"))
+    rows.sort(key=lambda row: row[0])
+    return rows
+
+
+def roster_rows(schedule):
+    """
+    Groups the schedule by nurse for per-nurse rosters.
+    :return: A dict of nurse label -> list of (date, weekday, shift type, ward, hours) rows in date order.
+    """
+    rosters = {}
+    for nurse in schedule.nurses:
+        shifts = sorted(schedule.assignments.get(nurse.nurse_id, []), key=lambda s: (s.date, s.shift_id))
+        rosters[f"{nurse.name} ({nurse.nurse_id})"] = [
+            (shift.date, datetime.strptime(shift.date, "%Y-%m-%d").strftime("%a"), shift.shift_type,
+             shift.ward or "", SHIFT_HOURS.get(shift.shift_type, 0))
+            for shift in shifts
+        ]
+    return rosters
+
+
+def _start_page(pdf, title, columns, page):
+    """Draws the title, column headers and page number. Returns the y of the first row."""
+    width, height = PAGE_SIZE
+    pdf.setFont(FONT + "-Bold", FONT_SIZE + 2)
+    pdf.drawString(MARGIN, height - MARGIN, title)
+    pdf.setFont(FONT, FONT_SIZE - 2)
+    pdf.drawRightString(width - MARGIN, MARGIN / 2, f"Page {page}")
+
+    y = height - MARGIN - 2 * ROW_HEIGHT
+    pdf.setFont(FONT + "-Bold", FONT_SIZE)
+    for header, x in columns:
+        pdf.drawString(MARGIN + x, y, header)
+    pdf.line(MARGIN, y - 4, width - MARGIN, y - 4)
+    pdf.setFont(FONT, FONT_SIZE)
+    return y - ROW_HEIGHT
+
+
+def write_table_pdf(path, title, columns, rows, progress=None):
+    """
+    Writes rows to a PDF page by page, repeating the title and headers on
+    every page. Rows can be any iterable, so they are never all held at once.
+    :param progress: Optional callback(rows written so far).
+    :return: The number of pages written.
+    """
+    pdf = canvas.Canvas(path, pagesize=PAGE_SIZE)
+    page = 1
+    y = _start_page(pdf, title, columns, page)
+    written = 0
+
+    for row in rows:
+        if y < MARGIN:
+            pdf.showPage()
+            page += 1
+            y = _start_page(pdf, title, columns, page)
+        for (_, x), value in zip(columns, row):
+            pdf.drawString(MARGIN + x, y, str(value))
+        y -= ROW_HEIGHT
+
+        written += 1
+        if progress is not None and written % PROGRESS_EVERY == 0:
+            progress(written)
+
+    if not written:
+        pdf.drawString(MARGIN, y, "No shifts scheduled.")
+    pdf.save()
+    if progress is not None:
+        progress(written)
+    return page
+
+
+def export_schedule_pdf(schedule, path="nurse_schedule.pdf", progress=None):
+    """
+    Exports the whole schedule as a paginated table.
+    :param progress: Optional callback(done, total) with rows written.
+    :return: The path written.
+    """
+    rows = schedule_rows(schedule)
+    callback = (lambda done: progress(done, len(rows))) if progress is not None else None
+    write_table_pdf(path, "Nurse Scheduling System - Final Schedule", SCHEDULE_COLUMNS, rows, callback)
+    return path
+
+
+def roster_filename(label):
+    """A safe file name for a nurse's roster, e.g. "Alice Johnson (1)" -> "roster_Alice_Johnson_1.pdf"."""
+    return "roster_" + re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_") + ".pdf"
+
+
+def export_nurse_roster(label, rows, path):
+    """Writes one nurse's roster PDF. Returns the path."""
+    hours = sum(row[4] for row in rows)
+    write_table_pdf(path, f"Roster - {label} ({len(rows)} shifts, {hours} hours)", ROSTER_COLUMNS, rows)
+    return path
+
+
+def export_rosters(jobs):
+    """Writes a list of (label, rows, path) rosters. Returns the paths."""
+    return [export_nurse_roster(label, rows, path) for label, rows, path in jobs]
+
+
+def export_all_rosters(schedule, directory, workers=None, progress=None):
+    """
+    Exports every nurse's roster to its own PDF.
+
+    Up to PARALLEL_ROSTER_MIN rosters are written in this thread. Larger
+    exports are split into one chunk per worker process, so each worker is
+    started once and only gets its nurses' rows, not the Schedule. Workers
+    are spawned rather than forked, since this runs from ExportJob's thread
+    inside the GUI process.
+    :param workers: Number of processes (default: one per CPU).
+    :param progress: Optional callback(done, total) with rosters written.
+    :return: The list of paths written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = [(label, rows, os.path.join(directory, roster_filename(label)))
+            for label, rows in roster_rows(schedule).items()]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    paths = []
+
+    if workers <= 1 or len(jobs) < PARALLEL_ROSTER_MIN:
+        for label, rows, path in jobs:
+            paths.append(export_nurse_roster(label, rows, path))
+            if progress is not None:
+                progress(len(paths), len(jobs))
+        return sorted(paths)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(export_rosters, jobs[start::workers]) for start in range(workers)]
+        for future in as_completed(futures):
+            paths.extend(future.result())
+            if progress is not None:
+                progress(len(paths), len(jobs))
+
+    return sorted(paths)
+
+
+class ExportJob:
+    """
+    Runs an export function on a daemon thread so the GUI stays responsive.
+
+    The function must accept a progress=callback(done, total) keyword. Events
+    are read with poll(): ("progress", (done, total)), then ("done", result)
+    or ("error", exception).
+    """
+
+    def __init__(self, export, *args, **kwargs):
+        self.events = queue.Queue()
+        self.thread = threading.Thread(target=self._run, args=(export, args, kwargs), name="ExportJob", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self, export, args, kwargs):
+        try:
+            result = export(*args, progress=lambda done, total: self.events.put(("progress", (done, total))), **kwargs)
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    def poll(self):
+        """Returns every event queued since the last call, without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+
+if __name__ == "__main__":
+    from models.genome import load_tables, genome_to_schedule
+    from scheduling_algorithms.constructive_heuristic import constructive_initialization
+
+    tables = load_tables()
+    schedule = genome_to_schedule(constructive_initialization(tables), tables)
+    print(f"✅ Schedule exported to {export_schedule_pdf(schedule)}")
+    print(f"✅ {len(export_all_rosters(schedule, 'rosters'))} rosters exported to rosters/")
@@ -0,0 +1,170 @@
+# data_handling/schedule_store.py
+
+import sqlite3
+import sys
+import os
+from datetime import datetime
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import data_handling.data_loader as data_loader
+
+
+def connect(db_path=None):
+    """
+    Opens the schedule database in WAL mode, so the GUI and loaders can keep
+    reading while a schedule is being written.
+    """
+    conn = sqlite3.connect(db_path or data_loader.DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA foreign_keys=ON;")
+    return conn
+
+
+def create_schedule_tables(cursor):
+    """
+    Creates the versioned schedule tables and the indexes used to look shifts
+    up by date and nurse. Safe to run on every save.
+    """
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schedule_versions (
+        version_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        created_at TEXT NOT NULL,
+        fitness REAL
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schedule_assignments (
+        version_id INTEGER NOT NULL,
+        shift_id INTEGER NOT NULL,
+        nurse_id INTEGER NOT NULL,
+        PRIMARY KEY (version_id, shift_id, nurse_id),
+        FOREIGN KEY (version_id) REFERENCES schedule_versions(version_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_date ON shifts(date);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_assigned_nurse ON shifts(assigned_nurse);")
+
+
+def schedule_rows(schedule):
+    """Returns the schedule's assignments as (shift_id, nurse_id) pairs."""
+    return [
+        (shift.shift_id, nurse_id)
+        for nurse_id, shifts in schedule.assignments.items()
+        for shift in shifts
+    ]
+
+
+def save_schedule(schedule, name=None, fitness=None, db_path=None):
+    """
+    Writes a schedule back to the database in one transaction.
+
+    The shifts table's assigned_nurse column is set for every shift (NULL for
+    unassigned ones). With a name, the assignments are also stored as a named
+    version that load_schedule() can bring back; saving under an existing name
+    replaces that version.
+    :param schedule: The Schedule to save.
+    :param name: Optional version name.
+    :param fitness: Optional fitness score stored with the version.
+    :param db_path: Database to write to (default: data_loader.DB_PATH).
+    :return: The number of assignments written.
+    """
+    rows = schedule_rows(schedule)
+    conn = connect(db_path)
+    try:
+        with conn:  # One transaction: commits on success, rolls back on error
+            cursor = conn.cursor()
+            create_schedule_tables(cursor)
+
+            # Shifts covered by several nurses keep the last one in the shifts table
+            cursor.execute("UPDATE shifts SET assigned_nurse = NULL;")
+            cursor.executemany("UPDATE shifts SET assigned_nurse = ? WHERE shift_id = ?;",
+                               [(nurse_id, shift_id) for shift_id, nurse_id in rows])
+
+            if name is not None:
+                cursor.execute("DELETE FROM schedule_versions WHERE name = ?;", (name,))
+                cursor.execute("INSERT INTO schedule_versions (name, created_at, fitness) VALUES (?, ?, ?);",
+                               (name, datetime.now().isoformat(timespec="seconds"), fitness))
+                version_id = cursor.lastrowid
+                cursor.executemany("INSERT OR IGNORE INTO schedule_assignments (version_id, shift_id, nurse_id) VALUES (?, ?, ?);",
+                                   [(version_id, shift_id, nurse_id) for shift_id, nurse_id in rows])
+    finally:
+        conn.close()
+
+    return len(rows)
+
+
+def load_schedule(name, db_path=None):
+    """
+    Rebuilds a Schedule from a saved version without running any algorithm.
+    :raises KeyError: If no version has that name.
+    """
+    from models.schedule import Schedule
+
+    conn = connect(db_path)
+    try:
+        create_schedule_tables(conn.cursor())
+        version = conn.execute("SELECT version_id FROM schedule_versions WHERE name = ?;", (name,)).fetchone()
+        if version is None:
+            raise KeyError(f"No saved schedule named '{name}'.")
+        rows = conn.execute("SELECT shift_id, nurse_id FROM schedule_assignments WHERE version_id = ?;",
+                            version).fetchall()
+    finally:
+        conn.close()
+
+    schedule = Schedule()
+    shifts_by_id = {shift.shift_id: shift for shift in schedule.shifts}
+    schedule.assignments = {nurse.nurse_id: [] for nurse in schedule.nurses}
+    for shift in schedule.shifts:
+        shift.assigned_nurse = None
+
+    for shift_id, nurse_id in rows:
+        shift = shifts_by_id.get(shift_id)
+        if shift is None:
+            continue  # The shift no longer exists, e.g. after setup_database()
+        shift.assigned_nurse = nurse_id
+        schedule.assignments.setdefault(nurse_id, []).append(shift)
+
+    return schedule
+
+
+def list_schedule_versions(db_path=None):
+    """Returns the saved versions, newest first, as a list of dictionaries."""
+    conn = connect(db_path)
+    try:
+        create_schedule_tables(conn.cursor())
+        rows = conn.execute("""
+            SELECT v.name, v.created_at, v.fitness, COUNT(a.shift_id)
+            FROM schedule_versions v
+            LEFT JOIN schedule_assignments a ON a.version_id = v.version_id
+            GROUP BY v.version_id
+            ORDER BY v.created_at DESC, v.version_id DESC;
+        """).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {"name": row[0], "created_at": row[1], "fitness": row[2], "assignments": row[3]}
+        for row in rows
+    ]
+
+
+def delete_schedule_version(name, db_path=None):
+    """Deletes a saved version. Returns True if it existed."""
+    conn = connect(db_path)
+    try:
+        with conn:
+            create_schedule_tables(conn.cursor())
+            deleted = conn.execute("DELETE FROM schedule_versions WHERE name = ?;", (name,)).rowcount
+    finally:
+        conn.close()
+    return deleted > 0
+
+
+if __name__ == "__main__":
+    for version in list_schedule_versions():
+        print(version)
@@ -0,0 +1,96 @@
+# evaluation/fitness_cache.py
+
+import sys
+import os
+from collections import OrderedDict
+from hashlib import blake2b
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation.fitness_function import evaluate_genome
+
+FITNESS_CACHE_SIZE = 10000  # Genomes remembered before the least recently used is dropped
+
+
+class FitnessCache:
+    """
+    LRU cache of genome fitness scores.
+
+    Keys are a digest of the tables' fingerprint plus the genome's shift -> nurse
+    slots, so identical assignments produced by different parents or algorithms
+    are scored only once, and genomes from different instances never collide.
+    """
+
+    def __init__(self, maxsize=FITNESS_CACHE_SIZE):
+        """
+        :param maxsize: Maximum number of scores kept.
+        """
+        self.maxsize = maxsize
+        self._scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, genome, tables):
+        """Returns the canonical key of a genome."""
+        digest = blake2b(tables.fingerprint, digest_size=16)
+        digest.update(genome.tobytes())
+        return digest.digest()
+
+    def get(self, genome, tables):
+        """Returns the cached score of a genome, or None."""
+        key = self.key(genome, tables)
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, genome, tables, score):
+        """Stores a genome's score, evicting the least recently used one if full."""
+        if self.maxsize <= 0:
+            return
+        key = self.key(genome, tables)
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self.maxsize:
+            self._scores.popitem(last=False)
+
+    def evaluate(self, genome, tables):
+        """Returns the score of a genome, computing it with evaluate_genome on a miss."""
+        score = self.get(genome, tables)
+        if score is None:
+            score = evaluate_genome(genome, tables)
+            self.put(genome, tables, score)
+        return score
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Returns the cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._scores),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Drops every cached score and resets the counters."""
+        self._scores.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._scores)
+
+
+# One cache shared by every algorithm in scheduling_algorithms (per process)
+shared_fitness_cache = FitnessCache()
@@ -8,14 +8,14 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from constraints.constraints import (
     SHIFT_HOURS, 
-    check_max_hours, 
-    check_consecutive_shifts, 
-    check_rest_period, 
+    check_nurse_constraints, 
     check_shift_coverage, 
-    check_nurse_preferences
+    check_nurse_preferences,
+    check_genome_constraints
 )
 from evaluation.workload_analysis import calculate_nurse_workload
 from models.schedule import Schedule
+from models.genome import UNASSIGNED, genome_nurse_shifts
 
 def evaluate_schedule(schedule: Schedule) -> float:
     """
@@ -35,11 +35,12 @@ def evaluate_schedule(schedule: Schedule) -> float:
 
     # ✅ 🔥 Adjusted Constraint Penalties 🔥
     for nurse in schedule.nurses:
-        if not check_max_hours(nurse, schedule):
+        max_hours_ok, consecutive_ok, rest_ok = check_nurse_constraints(nurse, schedule)
+        if not max_hours_ok:
             total_score -= 25  # Less severe penalty
-        if not check_consecutive_shifts(nurse, schedule):
+        if not consecutive_ok:
             total_score -= 20
-        if not check_rest_period(nurse, schedule):
+        if not rest_ok:
             total_score -= 20  
 
     # ✅ 🔥 Stronger Shift Coverage Reward 🔥
@@ -57,3 +58,44 @@ def evaluate_schedule(schedule: Schedule) -> float:
     total_score += workload_score * 1.5  # Boosted impact of fair workload
 
     return total_score
+
+def score_nurse(nurse_idx, shift_indices, tables) -> float:
+    """
+    Returns one nurse's contribution to the genome fitness: constraint penalties,
+    preference reward and the workload reward for the hours they cover.
+    """
+    score = 0
+
+    max_hours_ok, consecutive_ok, rest_ok = check_genome_constraints(shift_indices, tables)
+    if not max_hours_ok:
+        score -= 25
+    if not consecutive_ok:
+        score -= 20
+    if not rest_ok:
+        score -= 20
+
+    preferred = tables.preferred_types[nurse_idx]
+    hours = 0
+    for shift_idx in shift_indices:
+        if tables.shift_types[shift_idx] in preferred:
+            score += 15
+        hours += tables.shift_hours[shift_idx]
+
+    return score + hours * 1.5
+
+def evaluate_genome(genome, tables) -> float:
+    """
+    Calculates the fitness score of a genome.
+    Uses the same weights as evaluate_schedule, so a genome scores the same as
+    the Schedule built from it with genome_to_schedule.
+    """
+    unassigned_shifts = genome.count(UNASSIGNED)
+    total_score = -unassigned_shifts * 30
+
+    if unassigned_shifts == 0:
+        total_score += 200
+
+    for nurse_idx, shift_indices in enumerate(genome_nurse_shifts(genome, tables)):
+        total_score += score_nurse(nurse_idx, shift_indices, tables)
+
+    return total_score
@@ -0,0 +1,171 @@
+# evaluation/incremental_fitness.py
+
+import sys
+import os
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation.fitness_function import score_nurse, evaluate_genome
+from models.genome import UNASSIGNED, genome_nurse_shifts
+
+
+class IncrementalEvaluator:
+    """
+    Keeps the fitness of one genome up to date under small moves.
+
+    The per-nurse terms (constraint penalties, preference and workload rewards)
+    are cached, so a move only rescores the nurses it touches instead of the
+    whole roster. The genome passed in is modified in place.
+    """
+
+    def __init__(self, genome, tables, debug=False):
+        """
+        :param genome: The genome to track (modified in place by the moves).
+        :param tables: The shared ScheduleTables.
+        :param debug: If True, every move is checked against evaluate_genome.
+        """
+        self.genome = genome
+        self.tables = tables
+        self.debug = debug
+
+        self.nurse_shifts = genome_nurse_shifts(genome, tables)
+        self.nurse_scores = [
+            score_nurse(nurse_idx, shift_indices, tables)
+            for nurse_idx, shift_indices in enumerate(self.nurse_shifts)
+        ]
+        self.nurse_total = sum(self.nurse_scores)
+        self.unassigned = genome.count(UNASSIGNED)
+
+    @property
+    def score(self):
+        """The current fitness of the genome."""
+        score = self.nurse_total - self.unassigned * 30
+        if self.unassigned == 0:
+            score += 200
+        return score
+
+    def reassign(self, shift_idx, nurse_idx):
+        """
+        Gives a shift to another nurse (or UNASSIGNED) and returns the new score.
+        """
+        old_nurse = self.genome[shift_idx]
+        if old_nurse == nurse_idx:
+            return self.score
+
+        if old_nurse == UNASSIGNED:
+            self.unassigned -= 1
+        else:
+            self.nurse_shifts[old_nurse].remove(shift_idx)
+        if nurse_idx == UNASSIGNED:
+            self.unassigned += 1
+        else:
+            self.nurse_shifts[nurse_idx].append(shift_idx)
+
+        self.genome[shift_idx] = nurse_idx
+        self._rescore(old_nurse, nurse_idx)
+        return self._checked_score()
+
+    def swap(self, shift_a, shift_b):
+        """
+        Exchanges the nurses of two shifts and returns the new score.
+        """
+        nurse_a = self.genome[shift_a]
+        nurse_b = self.genome[shift_b]
+        if nurse_a == nurse_b:
+            return self.score
+
+        if nurse_a != UNASSIGNED:
+            shifts = self.nurse_shifts[nurse_a]
+            shifts[shifts.index(shift_a)] = shift_b
+        if nurse_b != UNASSIGNED:
+            shifts = self.nurse_shifts[nurse_b]
+            shifts[shifts.index(shift_b)] = shift_a
+
+        self.genome[shift_a] = nurse_b
+        self.genome[shift_b] = nurse_a
+        self._rescore(nurse_a, nurse_b)
+        return self._checked_score()
+
+    def reassign_delta(self, shift_idx, nurse_idx):
+        """
+        Returns the score change reassign() would make, without applying it.
+        """
+        old_nurse = self.genome[shift_idx]
+        if old_nurse == nurse_idx:
+            return 0
+
+        delta = 0
+        unassigned = self.unassigned
+        if old_nurse == UNASSIGNED:
+            unassigned -= 1
+        else:
+            shifts = [s for s in self.nurse_shifts[old_nurse] if s != shift_idx]
+            delta += score_nurse(old_nurse, shifts, self.tables) - self.nurse_scores[old_nurse]
+        if nurse_idx == UNASSIGNED:
+            unassigned += 1
+        else:
+            shifts = self.nurse_shifts[nurse_idx] + [shift_idx]
+            delta += score_nurse(nurse_idx, shifts, self.tables) - self.nurse_scores[nurse_idx]
+
+        return delta + self._fixed_terms(unassigned) - self._fixed_terms(self.unassigned)
+
+    def swap_delta(self, shift_a, shift_b):
+        """
+        Returns the score change swap() would make, without applying it.
+        """
+        nurse_a = self.genome[shift_a]
+        nurse_b = self.genome[shift_b]
+        if nurse_a == nurse_b:
+            return 0
+
+        delta = 0
+        if nurse_a != UNASSIGNED:
+            shifts = [shift_b if s == shift_a else s for s in self.nurse_shifts[nurse_a]]
+            delta += score_nurse(nurse_a, shifts, self.tables) - self.nurse_scores[nurse_a]
+        if nurse_b != UNASSIGNED:
+            shifts = [shift_a if s == shift_b else s for s in self.nurse_shifts[nurse_b]]
+            delta += score_nurse(nurse_b, shifts, self.tables) - self.nurse_scores[nurse_b]
+
+        return delta
+
+    def _fixed_terms(self, unassigned):
+        """Unassigned penalty and full coverage reward for a given unassigned count."""
+        return -unassigned * 30 + (200 if unassigned == 0 else 0)
+
+    def _rescore(self, *nurse_indices):
+        """Recomputes the cached terms of the touched nurses."""
+        for nurse_idx in set(nurse_indices):
+            if nurse_idx == UNASSIGNED:
+                continue
+            new_score = score_nurse(nurse_idx, self.nurse_shifts[nurse_idx], self.tables)
+            self.nurse_total += new_score - self.nurse_scores[nurse_idx]
+            self.nurse_scores[nurse_idx] = new_score
+
+    def _checked_score(self):
+        """Returns the score, comparing it with a full evaluation in debug mode."""
+        score = self.score
+        if self.debug:
+            full_score = evaluate_genome(self.genome, self.tables)
+            if abs(full_score - score) > 1e-6:
+                raise AssertionError(f"Incremental score {score} does not match full evaluation {full_score}")
+        return score
+
+
+# ✅ Debugging: Compare incremental and full evaluation on random moves
+if __name__ == "__main__":
+    import random
+    from array import array
+    from models.genome import load_tables
+
+    tables = load_tables()
+    genome = array("i", [random.randrange(tables.num_nurses) for _ in range(tables.num_shifts)])
+    evaluator = IncrementalEvaluator(genome, tables, debug=True)
+
+    for _ in range(1000):
+        if random.random() < 0.5:
+            evaluator.reassign(random.randrange(tables.num_shifts), random.randrange(-1, tables.num_nurses))
+        else:
+            evaluator.swap(random.randrange(tables.num_shifts), random.randrange(tables.num_shifts))
+
+    print(f"✅ 1000 incremental moves matched the full evaluation. Final score: {evaluator.score}")
@@ -0,0 +1,208 @@
+# evaluation/instrumentation.py
+
+import contextlib
+import cProfile
+import csv
+import io
+import json
+import pstats
+import sys
+import os
+import time
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import evaluation.fitness_function as fitness_function
+
+EVENTS = ("generation_start", "generation_end", "evaluation", "new_best")
+PHASES = ("evaluation", "selection", "crossover", "mutate", "output")
+
+
+def population_diversity(population):
+    """
+    Mean normalised Hamming distance between every pair of genomes:
+    0 when all genomes are identical, 1 when no two share any assignment.
+    Computed from per-shift value counts, so it is linear in the population size.
+    """
+    size = len(population)
+    if size < 2 or not len(population[0]):
+        return 0.0
+
+    differing_pairs = 0
+    for values in zip(*population):
+        counts = {}
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+        differing_pairs += (size * size - sum(c * c for c in counts.values())) // 2
+
+    pairs = size * (size - 1) // 2
+    return differing_pairs / (pairs * len(population[0]))
+
+
+class GAInstrumentation:
+    """
+    Collects per-generation telemetry from genetic_algorithm().
+
+    Callbacks can be registered for each event in EVENTS. Every generation
+    records the wall time of each phase, evaluations per second, time spent in
+    the constraint checks and the population diversity, and can be written to
+    a JSON-lines (or .csv) trace. One generation can be run under cProfile.
+    """
+
+    def __init__(self, trace_path=None, profile_generation=None, profile_path=None, time_constraints=True):
+        """
+        :param trace_path: File for the per-generation records; ".csv" gives CSV, anything else JSON lines.
+        :param profile_generation: Generation number (1-based) to run under cProfile, or None.
+        :param profile_path: Where to dump the profile (default: print the top functions).
+        :param time_constraints: Time check_genome_constraints calls made in this process.
+        """
+        self.trace_path = trace_path
+        self.profile_generation = profile_generation
+        self.profile_path = profile_path
+        self.time_constraints = time_constraints
+
+        self.hooks = {event: [] for event in EVENTS}
+        self.records = []
+        self._trace_file = None
+        self._csv_writer = None
+        self._profiler = None
+        self._reset_generation(0)
+
+    def add_hook(self, event, callback):
+        """
+        Registers a callback. It is called as callback(instrumentation, **data), where
+        data holds the generation number and event details (e.g. best_fitness).
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event '{event}'. Choose from {EVENTS}.")
+        self.hooks[event].append(callback)
+        return self
+
+    def _emit(self, event, **data):
+        for callback in self.hooks[event]:
+            callback(self, **data)
+
+    def _reset_generation(self, generation):
+        self.generation = generation
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+        self.evaluations = 0
+        self.constraint_seconds = 0.0
+        self.constraint_calls = 0
+        self._generation_start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Times a block and adds it to the current generation's phase totals."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def record_evaluations(self, count, scores=None):
+        """Counts genomes scored in this generation and fires the evaluation hooks."""
+        self.evaluations += count
+        self._emit("evaluation", generation=self.generation, count=count, scores=scores)
+
+    @contextlib.contextmanager
+    def running(self):
+        """
+        Wraps a whole GA run: opens the trace and, if enabled, times
+        check_genome_constraints by temporarily wrapping it.
+        """
+        original_check = fitness_function.check_genome_constraints
+
+        def timed_check(shift_indices, tables):
+            start = time.perf_counter()
+            result = original_check(shift_indices, tables)
+            self.constraint_seconds += time.perf_counter() - start
+            self.constraint_calls += 1
+            return result
+
+        if self.trace_path:
+            self._trace_file = open(self.trace_path, "w", newline="")
+        if self.time_constraints:
+            fitness_function.check_genome_constraints = timed_check
+        try:
+            yield self
+        finally:
+            fitness_function.check_genome_constraints = original_check
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+                self._csv_writer = None
+
+    def generation_start(self, generation):
+        """Called before each generation (1-based)."""
+        self._reset_generation(generation)
+        if generation == self.profile_generation:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._emit("generation_start", generation=generation)
+
+    def generation_end(self, population_scores, best_fitness):
+        """Called after each generation with its (genome, fitness) list and the best fitness so far."""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._write_profile()
+            self._profiler = None
+
+        elapsed = time.perf_counter() - self._generation_start
+        scores = [score for _, score in population_scores]
+        evaluation_time = self.phase_seconds["evaluation"]
+        record = {
+            "generation": self.generation,
+            "seconds": elapsed,
+            "best_fitness": best_fitness,
+            "generation_best": max(scores),
+            "mean_fitness": sum(scores) / len(scores),
+            "diversity": population_diversity([genome for genome, _ in population_scores]),
+            "evaluations": self.evaluations,
+            "evaluations_per_second": self.evaluations / evaluation_time if evaluation_time > 0 else None,
+            "constraint_seconds": self.constraint_seconds,
+            "constraint_calls": self.constraint_calls,
+        }
+        record.update({f"{name}_seconds": seconds for name, seconds in self.phase_seconds.items()})
+
+        self.records.append(record)
+        self._write_record(record)
+        self._emit("generation_end", **record)
+
+    def new_best(self, genome, fitness):
+        """Called whenever the best fitness improves."""
+        self._emit("new_best", generation=self.generation, genome=genome, best_fitness=fitness)
+
+    def _write_record(self, record):
+        if self._trace_file is None:
+            return
+        if self.trace_path.endswith(".csv"):
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(self._trace_file, fieldnames=list(record))
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(record)
+        else:
+            self._trace_file.write(json.dumps(record) + "\n")
+        self._trace_file.flush()
+
+    def _write_profile(self):
+        if self.profile_path:
+            self._profiler.dump_stats(self.profile_path)
+            return
+        output = io.StringIO()
+        pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(20)
+        print(f"📊 Profile of generation {self.generation}:\n{output.getvalue()}")
+
+    def summary(self):
+        """Totals over all recorded generations."""
+        totals = {f"{name}_seconds": sum(r.get(f"{name}_seconds", 0.0) for r in self.records) for name in PHASES}
+        totals["generations"] = len(self.records)
+        totals["seconds"] = sum(r["seconds"] for r in self.records)
+        totals["evaluations"] = sum(r["evaluations"] for r in self.records)
+        totals["constraint_seconds"] = sum(r["constraint_seconds"] for r in self.records)
+        return totals
+
+
+def phase(instrumentation, name):
+    """instrumentation.phase(name), or a no-op when instrumentation is None."""
+    return instrumentation.phase(name) if instrumentation is not None else contextlib.nullcontext()
@@ -0,0 +1,157 @@
+# evaluation/vectorized_fitness.py
+
+import sys
+import os
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from constraints.constraints import MAX_HOURS_PER_WEEK, MAX_CONSECUTIVE_SHIFTS, MIN_HOURS_BETWEEN_SHIFTS
+
+
+class VectorizedEvaluator:
+    """
+    Scores a whole population of genomes in one batched NumPy pass.
+
+    The population is an individuals x shifts integer matrix of nurse indices
+    (UNASSIGNED = -1). Gives the same scores as evaluate_genome.
+    """
+
+    def __init__(self, tables):
+        """
+        :param tables: The shared ScheduleTables.
+        """
+        if np is None:
+            raise ImportError("The vectorized evaluator needs NumPy. Install it with 'pip install numpy'.")
+
+        self.num_nurses = tables.num_nurses
+        self.num_shifts = tables.num_shifts
+        self.shift_positions = np.arange(self.num_shifts)
+
+        days = np.array(tables.shift_days, dtype=np.int64)
+        weeks = np.array(tables.shift_weeks, dtype=np.int64)
+        self.hours = np.array(tables.shift_hours, dtype=np.int64)
+
+        # Dense day and week indices so they can be used as bincount bins
+        first_day = days.min() if self.num_shifts else 0
+        self.day_index = days - first_day
+        self.num_days = int(self.day_index.max()) + 1 if self.num_shifts else 0
+        week_values, self.week_index = np.unique(weeks, return_inverse=True)
+        self.num_weeks = len(week_values)
+
+        # Shift start and end in hours from the first day
+        self.start_hours = np.array(tables.shift_starts, dtype=np.int64) - first_day * 24
+        self.end_hours = np.array(tables.shift_ends, dtype=np.int64) - first_day * 24
+
+        # Preference matrix with an extra all-False row for unassigned shifts
+        self.prefers = np.zeros((self.num_nurses + 1, self.num_shifts), dtype=bool)
+        for nurse_idx, preferred in enumerate(tables.preferred_types):
+            self.prefers[nurse_idx] = [shift_type in preferred for shift_type in tables.shift_types]
+
+    def population_matrix(self, population):
+        """Stacks array("i") genomes into an individuals x shifts matrix."""
+        if not population:
+            return np.zeros((0, self.num_shifts), dtype=np.intc)
+        buffer = b"".join(genome.tobytes() for genome in population)
+        return np.frombuffer(buffer, dtype=np.intc).reshape(len(population), self.num_shifts)
+
+    def evaluate_matrix(self, matrix):
+        """
+        Scores every row of an individuals x shifts matrix.
+        :return: A float array with one fitness score per individual.
+        """
+        individuals = matrix.shape[0]
+        slots = self.num_nurses + 1  # Nurse slots per individual, the last one collects unassigned shifts
+
+        assigned = matrix >= 0
+        nurses = np.where(assigned, matrix, self.num_nurses)
+        owner = np.arange(individuals)[:, None] * slots + nurses  # (individual, nurse) bin per shift
+
+        # Unassigned shifts and the full coverage reward
+        unassigned = (~assigned).sum(axis=1)
+        scores = unassigned * -30.0 + np.where(unassigned == 0, 200.0, 0.0)
+
+        # Preference matches and workload
+        scores += self.prefers[nurses, self.shift_positions].sum(axis=1) * 15
+        scores += (self.hours * assigned).sum(axis=1) * 1.5
+
+        # Weekly hours over MAX_HOURS_PER_WEEK
+        weekly_hours = np.bincount(
+            (owner * self.num_weeks + self.week_index).ravel(),
+            weights=np.broadcast_to(self.hours, matrix.shape).ravel(),
+            minlength=individuals * slots * self.num_weeks
+        ).reshape(individuals, slots, self.num_weeks)
+        max_hours_violations = (weekly_hours > MAX_HOURS_PER_WEEK).any(axis=2)[:, :-1]
+
+        # Runs of more than MAX_CONSECUTIVE_SHIFTS worked days
+        worked_days = np.bincount(
+            (owner * self.num_days + self.day_index).ravel(),
+            minlength=individuals * slots * self.num_days
+        ).reshape(individuals, slots, self.num_days) > 0
+        window = MAX_CONSECUTIVE_SHIFTS + 1
+        if self.num_days >= window:
+            days_worked = np.concatenate(
+                [np.zeros((individuals, slots, 1), dtype=np.int64), worked_days.cumsum(axis=2)], axis=2
+            )
+            consecutive_violations = ((days_worked[:, :, window:] - days_worked[:, :, :-window]) == window).any(axis=2)[:, :-1]
+        else:
+            consecutive_violations = np.zeros((individuals, self.num_nurses), dtype=bool)
+
+        # Rest gaps: order each individual's shifts by nurse then start time and compare neighbours
+        order = np.lexsort((np.broadcast_to(self.start_hours, matrix.shape), nurses))
+        sorted_nurses = np.take_along_axis(nurses, order, axis=1)
+        starts = self.start_hours[order]
+        ends = self.end_hours[order]
+        short_rest = (
+            (sorted_nurses[:, 1:] == sorted_nurses[:, :-1])
+            & (sorted_nurses[:, 1:] < self.num_nurses)
+            & (starts[:, 1:] - ends[:, :-1] < MIN_HOURS_BETWEEN_SHIFTS)
+        )
+        rest_owner = np.arange(individuals)[:, None] * slots + sorted_nurses[:, 1:]
+        rest_violations = (np.bincount(
+            rest_owner.ravel(), weights=short_rest.ravel(), minlength=individuals * slots
+        ).reshape(individuals, slots) > 0)[:, :-1]
+
+        scores -= max_hours_violations.sum(axis=1) * 25
+        scores -= consecutive_violations.sum(axis=1) * 20
+        scores -= rest_violations.sum(axis=1) * 20
+        return scores
+
+    def __call__(self, population):
+        """Scores a list of genomes and returns a list of floats in the same order."""
+        return self.evaluate_matrix(self.population_matrix(population)).tolist()
+
+
+# ✅ Debugging: Check the vectorized scores against evaluate_genome
+if __name__ == "__main__":
+    import random
+    import time
+    from array import array
+    from models.genome import load_tables
+    from evaluation.fitness_function import evaluate_genome
+
+    tables = load_tables()
+    evaluator = VectorizedEvaluator(tables)
+    population = [
+        array("i", [random.randrange(-1, tables.num_nurses) for _ in range(tables.num_shifts)])
+        for _ in range(500)
+    ]
+
+    start = time.perf_counter()
+    python_scores = [evaluate_genome(genome, tables) for genome in population]
+    python_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    numpy_scores = evaluator(population)
+    numpy_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(python_scores, numpy_scores) if abs(a - b) > 1e-6)
+    print(f"{'✅' if not mismatches else '❌'} {len(population) - mismatches}/{len(population)} scores match "
+          f"(Python {python_time:.3f}s, NumPy {numpy_time:.3f}s)")
+    if mismatches:
+        sys.exit(1)
@@ -1,50 +1,508 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from data_handling.pdf_export import ExportJob, export_all_rosters, export_schedule_pdf, schedule_rows
+from scheduling_algorithms.background_solver import BackgroundSolver
+
+ROW_HEIGHT = 22  # Pixels per table row
+SHIFT_TYPE_LABELS = {"Morning": "M", "Afternoon": "A", "Night": "N"}  # Roster grid cell text
+SHIFT_TYPE_FILTERS = ["All", "Morning", "Afternoon", "Night"]
 
 def export_schedule_to_pdf(schedule):
     """
-    Exports the current schedule to a PDF file.
+    Exports the current schedule to a PDF file, blocking until it is written.
+    The GUI uses ExportPanel, which does the same off the UI thread.
     """
     try:
-        pdf_file = "nurse_schedule.pdf"
-        c = canvas.Canvas(pdf_file, pagesize=letter)
-        width, height = letter
-
-        c.setFont("Helvetica", 12)
-        c.drawString(100, height - 50, "Nurse Scheduling System - Final Schedule")
-
-        # Table headers
-        headers = ["Shift ID", "Date", "Shift Type", "Assigned Nurse"]
-        for col, header in enumerate(headers):
-            c.drawString(100 + col * 150, height - 100, header)
-
-        # Sort shifts in order (1 to 42)
-        all_shifts = []
-        for nurse_id, shifts in schedule.assignments.items():
-            for shift in shifts:
-                all_shifts.append((shift.shift_id, shift.date, shift.shift_type, nurse_id))
-
-        all_shifts.sort(key=lambda x: int(x[0]))  # Sort by Shift ID (1 to 42)
-
-        # Add shift data to the PDF
-        y_position = height - 120
-        for shift_id, date, shift_type, nurse_id in all_shifts:
-            c.drawString(100, y_position, str(shift_id))
-            c.drawString(250, y_position, date)
-            c.drawString(400, y_position, shift_type)
-            c.drawString(550, y_position, f"Nurse {nurse_id}")
-            y_position -= 20  # Move to the next row
-
-        c.save()  # Save the PDF
+        pdf_file = export_schedule_pdf(schedule, "nurse_schedule.pdf")
         messagebox.showinfo("Success", f"Schedule exported as {pdf_file}")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to export schedule: {str(e)}")
 
-def display_schedule(schedule):
+def _bind_mousewheel(widget, scroll_units):
+    """Scrolls with the mouse wheel on Windows/macOS (<MouseWheel>) and X11 (<Button-4/5>)."""
+    widget.bind("<MouseWheel>", lambda e: scroll_units(-1 if e.delta > 0 else 1))
+    widget.bind("<Button-4>", lambda e: scroll_units(-1))
+    widget.bind("<Button-5>", lambda e: scroll_units(1))
+
+class VirtualTable(ttk.Frame):
+    """
+    A table drawn on a canvas that only draws the rows in view, so it opens and
+    scrolls as fast with 40,000 shifts as with 40. Click a header to sort.
+    """
+
+    def __init__(self, parent, columns, rows=(), column_width=150):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.column_width = column_width
+        self.all_rows = list(rows)
+        self.rows = self.all_rows
+        self.predicate = None
+        self.first_row = 0
+        self.sort_column = None
+        self.sort_reverse = False
+
+        self.header = tk.Canvas(self, height=ROW_HEIGHT, highlightthickness=0)
+        self.body = tk.Canvas(self, background="white", highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._scroll)
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.header.bind("<Button-1>", self._on_header_click)
+        self.body.bind("<Configure>", lambda e: self.redraw())
+        _bind_mousewheel(self.body, lambda units: self._scroll("scroll", units, "units"))
+        self._draw_header()
+
+    def set_rows(self, rows):
+        """Replaces the data, keeping the current sort and filter."""
+        self.all_rows = list(rows)
+        if self.sort_column is not None:
+            self.all_rows.sort(key=lambda row: row[self.sort_column], reverse=self.sort_reverse)
+        self.set_filter(self.predicate)
+
+    def set_filter(self, predicate=None):
+        """Shows only the rows for which predicate(row) is true (None shows everything)."""
+        self.predicate = predicate
+        self.rows = [row for row in self.all_rows if predicate(row)] if predicate else self.all_rows
+        self.first_row = 0
+        self.redraw()
+
+    def sort_by(self, column):
+        """Sorts by a column; sorting by the same column again reverses the order."""
+        self.sort_reverse = self.sort_column == column and not self.sort_reverse
+        self.sort_column = column
+        self.all_rows.sort(key=lambda row: row[column], reverse=self.sort_reverse)
+        self._draw_header()
+        self.set_filter(self.predicate)
+
+    def visible_rows(self):
+        return max(1, self.body.winfo_height() // ROW_HEIGHT)
+
+    def _scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first_row = int(float(amount) * len(self.rows))
+        else:
+            step = self.visible_rows() if unit == "pages" else 1
+            self.first_row += int(amount) * step
+        self.redraw()
+
+    def _on_header_click(self, event):
+        column = event.x // self.column_width
+        if column < len(self.columns):
+            self.sort_by(column)
+
+    def _draw_header(self):
+        self.header.delete("all")
+        for column, name in enumerate(self.columns):
+            x = column * self.column_width
+            arrow = (" ▼" if self.sort_reverse else " ▲") if column == self.sort_column else ""
+            self.header.create_rectangle(x, 0, x + self.column_width, ROW_HEIGHT, fill="#dddddd", outline="gray")
+            self.header.create_text(x + 5, ROW_HEIGHT // 2, text=name + arrow, anchor="w", font=("Arial", 10, "bold"))
+
+    def redraw(self):
+        """Draws the rows currently in view and nothing else."""
+        self.body.delete("all")
+        visible = self.visible_rows()
+        self.first_row = max(0, min(self.first_row, len(self.rows) - visible))
+        width = len(self.columns) * self.column_width
+
+        for offset, row in enumerate(self.rows[self.first_row:self.first_row + visible + 1]):
+            y = offset * ROW_HEIGHT
+            color = "lightgray" if (self.first_row + offset) % 2 else "white"  # Alternate row colors
+            self.body.create_rectangle(0, y, width, y + ROW_HEIGHT, fill=color, outline="")
+            for column, value in enumerate(row):
+                self.body.create_text(column * self.column_width + 5, y + ROW_HEIGHT // 2, text=value, anchor="w")
+
+        total = max(1, len(self.rows))
+        self.scrollbar.set(self.first_row / total, min(1.0, (self.first_row + visible) / total))
+
+class RosterGrid(ttk.Frame):
+    """
+    Nurse x day roster drawn on a canvas. Only the cells in view are drawn.
+    Click the "Nurse" header to sort by name, or a date to bring the nurses
+    working that day to the top.
+    """
+
+    NAME_WIDTH = 180
+    CELL_WIDTH = 70
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.nurses = []  # (nurse_id, label) for every nurse
+        self.all_days = []
+        self.cells = {}  # (nurse_id, date) -> [shift types]
+        self.row_keys = []  # Nurses shown, in display order
+        self.days = []  # Dates shown
+        self.shift_type = None
+        self.first_row = 0
+        self.first_column = 0
+        self.sort_key = None
+
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=0)
+        self.vertical = ttk.Scrollbar(self, orient="vertical", command=lambda *a: self._scroll("rows", *a))
+        self.horizontal = ttk.Scrollbar(self, orient="horizontal", command=lambda *a: self._scroll("columns", *a))
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.vertical.grid(row=0, column=1, sticky="ns")
+        self.horizontal.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        _bind_mousewheel(self.canvas, lambda units: self._scroll("rows", "scroll", units, "units"))
+
+    def set_rows(self, rows):
+        """Rebuilds the grid from schedule_rows() output."""
+        nurses = {}
+        self.cells = {}
+        for _, date, shift_type, _, label in rows:
+            if label == "Unassigned":
+                continue
+            nurses[label] = label
+            self.cells.setdefault((label, date), []).append(shift_type)
+        self.nurses = sorted(nurses)
+        self.all_days = sorted({row[1] for row in rows})
+        self.set_filter()
+
+    def set_filter(self, nurse_text="", date_text="", shift_type=None):
+        """
+        :param nurse_text: Only nurses whose label contains this text.
+        :param date_text: Only dates starting with this text (e.g. "2025-03").
+        :param shift_type: Only show cells with this shift type (None for all).
+        """
+        nurse_text = nurse_text.lower()
+        self.shift_type = shift_type
+        self.row_keys = [nurse for nurse in self.nurses if nurse_text in nurse.lower()]
+        self.days = [day for day in self.all_days if day.startswith(date_text)]
+        self._apply_sort()
+        self.first_row = self.first_column = 0
+        self.redraw()
+
+    def _apply_sort(self):
+        if self.sort_key == "name_desc":
+            self.row_keys.sort(reverse=True)
+        elif self.sort_key is not None and self.sort_key != "name":
+            self.row_keys.sort(key=lambda nurse: (nurse, self.sort_key) not in self.cells)
+        else:
+            self.row_keys.sort()
+
+    def _visible(self):
+        rows = max(1, self.canvas.winfo_height() // ROW_HEIGHT - 1)
+        columns = max(1, (self.canvas.winfo_width() - self.NAME_WIDTH) // self.CELL_WIDTH)
+        return rows, columns
+
+    def _scroll(self, axis, action, amount, unit=None):
+        rows, columns = self._visible()
+        total, page = (len(self.row_keys), rows) if axis == "rows" else (len(self.days), columns)
+        if action == "moveto":
+            position = int(float(amount) * total)
+        else:
+            current = self.first_row if axis == "rows" else self.first_column
+            position = current + int(amount) * (page if unit == "pages" else 1)
+        if axis == "rows":
+            self.first_row = position
+        else:
+            self.first_column = position
+        self.redraw()
+
+    def _on_click(self, event):
+        if event.y > ROW_HEIGHT:
+            return
+        if event.x < self.NAME_WIDTH:
+            self.sort_key = "name_desc" if self.sort_key == "name" else "name"
+        else:
+            column = self.first_column + (event.x - self.NAME_WIDTH) // self.CELL_WIDTH
+            if column >= len(self.days):
+                return
+            self.sort_key = self.days[column]
+        self._apply_sort()
+        self.redraw()
+
+    def redraw(self):
+        """Draws the headers and the cells currently in view."""
+        canvas = self.canvas
+        canvas.delete("all")
+        rows, columns = self._visible()
+        self.first_row = max(0, min(self.first_row, len(self.row_keys) - rows))
+        self.first_column = max(0, min(self.first_column, len(self.days) - columns))
+        days = self.days[self.first_column:self.first_column + columns + 1]
+        nurses = self.row_keys[self.first_row:self.first_row + rows + 1]
+
+        # Header row
+        canvas.create_rectangle(0, 0, self.NAME_WIDTH, ROW_HEIGHT, fill="#dddddd", outline="gray")
+        canvas.create_text(5, ROW_HEIGHT // 2, text="Nurse", anchor="w", font=("Arial", 10, "bold"))
+        for i, day in enumerate(days):
+            x = self.NAME_WIDTH + i * self.CELL_WIDTH
+            canvas.create_rectangle(x, 0, x + self.CELL_WIDTH, ROW_HEIGHT, fill="#dddddd", outline="gray")
+            canvas.create_text(x + self.CELL_WIDTH // 2, ROW_HEIGHT // 2, text=day[5:], font=("Arial", 9, "bold"))
+
+        # Nurse rows
+        for r, nurse in enumerate(nurses, start=1):
+            y = r * ROW_HEIGHT
+            color = "lightgray" if (self.first_row + r) % 2 == 0 else "white"
+            canvas.create_rectangle(0, y, self.NAME_WIDTH, y + ROW_HEIGHT, fill=color, outline="gray")
+            canvas.create_text(5, y + ROW_HEIGHT // 2, text=nurse, anchor="w")
+            for i, day in enumerate(days):
+                shift_types = self.cells.get((nurse, day), [])
+                if self.shift_type is not None:
+                    shift_types = [t for t in shift_types if t == self.shift_type]
+                x = self.NAME_WIDTH + i * self.CELL_WIDTH
+                fill = "#cce5ff" if shift_types else color
+                canvas.create_rectangle(x, y, x + self.CELL_WIDTH, y + ROW_HEIGHT, fill=fill, outline="gray")
+                if shift_types:
+                    text = "+".join(SHIFT_TYPE_LABELS.get(t, t[:1]) for t in shift_types)
+                    canvas.create_text(x + self.CELL_WIDTH // 2, y + ROW_HEIGHT // 2, text=text)
+
+        total_rows = max(1, len(self.row_keys))
+        total_days = max(1, len(self.days))
+        self.vertical.set(self.first_row / total_rows, min(1.0, (self.first_row + rows) / total_rows))
+        self.horizontal.set(self.first_column / total_days, min(1.0, (self.first_column + columns) / total_days))
+
+class ScheduleViewer(ttk.Frame):
+    """
+    Filter bar plus two views of a schedule: a sortable shift table and a
+    nurse x day roster grid. Both only draw what is on screen.
+    """
+
+    def __init__(self, parent, schedule=None):
+        super().__init__(parent)
+        self._filter_job = None
+
+        # Filter bar
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, pady=(0, 5))
+        self.nurse_filter = tk.StringVar()
+        self.date_filter = tk.StringVar()
+        self.shift_type_filter = tk.StringVar(value="All")
+        ttk.Label(bar, text="Nurse:").pack(side=tk.LEFT)
+        ttk.Entry(bar, textvariable=self.nurse_filter, width=20).pack(side=tk.LEFT, padx=(2, 10))
+        ttk.Label(bar, text="Date:").pack(side=tk.LEFT)
+        ttk.Entry(bar, textvariable=self.date_filter, width=12).pack(side=tk.LEFT, padx=(2, 10))
+        ttk.Label(bar, text="Shift type:").pack(side=tk.LEFT)
+        ttk.Combobox(bar, textvariable=self.shift_type_filter, values=SHIFT_TYPE_FILTERS,
+                     state="readonly", width=10).pack(side=tk.LEFT, padx=2)
+        for variable in (self.nurse_filter, self.date_filter, self.shift_type_filter):
+            variable.trace_add("write", lambda *args: self._schedule_filter())
+
+        # Views
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        self.table = VirtualTable(notebook, ["Shift ID", "Date", "Shift Type", "Ward", "Assigned Nurse"])
+        self.roster = RosterGrid(notebook)
+        notebook.add(self.table, text="Shifts")
+        notebook.add(self.roster, text="Roster")
+
+        if schedule is not None:
+            self.set_schedule(schedule)
+
+    def set_schedule(self, schedule):
+        """Shows another schedule, keeping the filters."""
+        rows = schedule_rows(schedule)
+        self.table.set_rows(rows)
+        self.roster.set_rows(rows)
+        self.apply_filters()
+
+    def _schedule_filter(self):
+        # Wait for a pause in typing before filtering large rosters
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(200, self.apply_filters)
+
+    def apply_filters(self):
+        self._filter_job = None
+        nurse_text = self.nurse_filter.get().strip().lower()
+        date_text = self.date_filter.get().strip()
+        shift_type = self.shift_type_filter.get()
+        shift_type = None if shift_type == "All" else shift_type
+
+        def matches(row):
+            return (nurse_text in row[4].lower() and row[1].startswith(date_text)
+                    and (shift_type is None or row[2] == shift_type))
+
+        self.table.set_filter(matches if nurse_text or date_text or shift_type else None)
+        self.roster.set_filter(nurse_text, date_text, shift_type)
+
+class SolverPanel(ttk.Frame):
+    """
+    Solve/Cancel buttons, a status line and a live best-fitness curve for a
+    genetic_algorithm() run on a background thread. The Tk mainloop only polls
+    the solver's queue every POLL_MS, so it never blocks on the solve.
+    """
+
+    POLL_MS = 100
+    CURVE_HEIGHT = 120
+
+    def __init__(self, parent, on_result, **solver_options):
+        """
+        :param on_result: Called with the Schedule when a run finishes or is cancelled.
+        :param solver_options: Keyword arguments for genetic_algorithm() (e.g. time_budget).
+        """
+        super().__init__(parent)
+        self.on_result = on_result
+        self.solver_options = solver_options
+        self.solver = None
+        self.history = []  # (generation, best fitness)
+
+        controls = ttk.Frame(self)
+        controls.pack(fill=tk.X)
+        self.solve_button = ttk.Button(controls, text="Solve", command=self.start)
+        self.solve_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(controls, text="Cancel", command=self.cancel, state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        self.status = tk.StringVar(value="Ready")
+        ttk.Label(controls, textvariable=self.status).pack(side=tk.LEFT, padx=10)
+
+        self.curve = tk.Canvas(self, height=self.CURVE_HEIGHT, background="white", highlightthickness=1)
+        self.curve.pack(fill=tk.X, pady=5)
+        self.curve.bind("<Configure>", lambda e: self._draw_curve())
+
+    def start(self):
+        """Starts a solve on a worker thread."""
+        if self.solver is not None and self.solver.running:
+            return
+        self.history = []
+        self.solver = BackgroundSolver(**self.solver_options).start()
+        self.solve_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.status.set("Solving...")
+        self.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        """Stops the solve after the current generation and keeps the best schedule so far."""
+        if self.solver is not None:
+            self.solver.cancel()
+            self.cancel_button.configure(state="disabled")
+            self.status.set("Cancelling...")
+
+    def _poll(self):
+        finished = False
+        for kind, data in self.solver.poll():
+            if kind == "progress":
+                self.history.append((data["generation"], data["best_fitness"]))
+                self.status.set(f"Generation {data['generation']} · {data['evaluations']} evaluations · "
+                                f"best fitness {data['best_fitness']} · {data['seconds']:.1f}s")
+            elif kind == "done":
+                finished = True
+                cancelled = self.solver.cancel_event.is_set()
+                self.status.set(f"{'Cancelled' if cancelled else 'Finished'} after "
+                                f"{len(self.history)} generations, best fitness "
+                                f"{self.history[-1][1] if self.history else 'n/a'}")
+                self.on_result(data)
+            else:
+                finished = True
+                self.status.set("Solve failed")
+                messagebox.showerror("Error", f"Solve failed: {data}")
+
+        self._draw_curve()
+        if finished:
+            self.solve_button.configure(state="normal")
+            self.cancel_button.configure(state="disabled")
+        else:
+            self.after(self.POLL_MS, self._poll)
+
+    def _draw_curve(self):
+        """Plots best fitness against generation, at most one point per pixel."""
+        self.curve.delete("all")
+        if len(self.history) < 2:
+            return
+
+        width = max(2, self.curve.winfo_width())
+        height = self.CURVE_HEIGHT
+        step = max(1, len(self.history) // width)
+        points = self.history[::step] + ([self.history[-1]] if (len(self.history) - 1) % step else [])
+
+        first_generation, last_generation = points[0][0], points[-1][0]
+        low = min(fitness for _, fitness in points)
+        high = max(fitness for _, fitness in points)
+        span_x = max(1, last_generation - first_generation)
+        span_y = (high - low) or 1
+
+        coords = []
+        for generation, fitness in points:
+            coords.append(5 + (generation - first_generation) / span_x * (width - 10))
+            coords.append(height - 15 - (fitness - low) / span_y * (height - 30))
+        self.curve.create_line(*coords, fill="blue", width=2)
+        self.curve.create_text(5, 5, text=f"{high}", anchor="nw", font=("Arial", 8))
+        self.curve.create_text(5, height - 5, text=f"{low}", anchor="sw", font=("Arial", 8))
+
+class ExportPanel(ttk.Frame):
     """
-    Displays the final optimized schedule in a scrollable timetable format.
+    Buttons to export the schedule PDF or every nurse's roster PDF, with a
+    progress bar. Exports run on a background thread (rosters in a process
+    pool) and are polled every POLL_MS, so the window stays responsive.
+    """
+
+    POLL_MS = 100
+    ROSTER_DIRECTORY = "rosters"
+
+    def __init__(self, parent, get_schedule):
+        """
+        :param get_schedule: Returns the Schedule currently shown, or None.
+        """
+        super().__init__(parent)
+        self.get_schedule = get_schedule
+        self.job = None
+
+        self.buttons = [
+            ttk.Button(self, text="Export Schedule to PDF",
+                       command=lambda: self.start(export_schedule_pdf, "nurse_schedule.pdf")),
+            ttk.Button(self, text="Export Nurse Rosters",
+                       command=lambda: self.start(export_all_rosters, self.ROSTER_DIRECTORY)),
+        ]
+        for button in self.buttons:
+            button.pack(side=tk.LEFT, padx=(0, 5))
+        self.progress = ttk.Progressbar(self, length=200, mode="determinate")
+        self.progress.pack(side=tk.LEFT, padx=10)
+        self.status = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.status).pack(side=tk.LEFT)
+
+    def start(self, export, target):
+        """Runs export(schedule, target, progress=...) on a worker thread."""
+        schedule = self.get_schedule()
+        if schedule is None:
+            messagebox.showinfo("Export", "Solve a schedule first.")
+            return
+        if self.job is not None and self.job.running:
+            return
+        self.job = ExportJob(export, schedule, target).start()
+        for button in self.buttons:
+            button.configure(state="disabled")
+        self.progress.configure(value=0)
+        self.status.set("Exporting...")
+        self.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        finished = False
+        for kind, data in self.job.poll():
+            if kind == "progress":
+                done, total = data
+                self.progress.configure(maximum=max(1, total), value=done)
+                self.status.set(f"Exporting... {done}/{total}")
+            elif kind == "done":
+                finished = True
+                written = f"{len(data)} rosters to {self.ROSTER_DIRECTORY}/" if isinstance(data, list) else data
+                self.status.set(f"Exported {written}")
+                messagebox.showinfo("Success", f"Exported {written}")
+            else:
+                finished = True
+                self.status.set("Export failed")
+                messagebox.showerror("Error", f"Failed to export schedule: {data}")
+
+        if finished:
+            for button in self.buttons:
+                button.configure(state="normal")
+        else:
+            self.after(self.POLL_MS, self._poll)
+
+def display_schedule(schedule=None, splash_seconds=0, **solver_options):
+    """
+    Displays the final optimized schedule in a sortable, filterable table and roster grid,
+    with a panel to run the solver again in the background.
+    :param schedule: Schedule to show first (None starts empty; press Solve).
+    :param splash_seconds: Show the welcome screen for this long first (0 skips it).
+    :param solver_options: Keyword arguments for genetic_algorithm() used by the Solve button.
     """
 
     # Create main window
@@ -52,67 +510,37 @@ def display_schedule(schedule):
     root.title("Nurse Scheduling - Timetable View")
 
     # Configure window size
-    root.geometry("800x600")
+    root.geometry("1000x800")
+    current = {"schedule": schedule}
 
-    # Add an opening screen (splash screen)
-    splash_frame = tk.Frame(root)
-    splash_frame.pack(fill=tk.BOTH, expand=True)
+    def display_schedule_table():
+        viewer = ScheduleViewer(root, schedule)
 
-    splash_label = tk.Label(splash_frame, text="Welcome to Nurse Scheduling System", font=("Arial", 18, "bold"))
-    splash_label.pack(pady=50)
+        def show_result(new_schedule):
+            current["schedule"] = new_schedule
+            viewer.set_schedule(new_schedule)
 
-    def close_splash():
-        splash_frame.destroy()
-        display_schedule_table()  # Proceed to the main schedule
+        SolverPanel(root, show_result, **solver_options).pack(fill=tk.X, padx=10, pady=(10, 0))
+        viewer.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-    # Set splash screen duration (3 seconds)
-    root.after(3000, close_splash)
+        # Add the PDF export buttons
+        ExportPanel(root, lambda: current["schedule"]).pack(pady=10)
 
-    def display_schedule_table():
-        # Create a frame for the table with a scrollbar
-        frame = tk.Frame(root)
-        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        # Configure scrollbar
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Create table headers
-        headers = ["Shift ID", "Date", "Shift Type", "Assigned Nurse"]
-        for col, header in enumerate(headers):
-            ttk.Label(scrollable_frame, text=header, font=("Arial", 10, "bold"), borderwidth=2, relief="solid", padding=5).grid(row=0, column=col, sticky="nsew")
-
-        # Sort shifts in order (1 to 42)
-        all_shifts = []
-        for nurse_id, shifts in schedule.assignments.items():
-            for shift in shifts:
-                all_shifts.append((shift.shift_id, shift.date, shift.shift_type, nurse_id))
-
-        all_shifts.sort(key=lambda x: int(x[0]))  # Sort by Shift ID (1 to 42)
-
-        # Add shift data to the table
-        for row, (shift_id, date, shift_type, nurse_id) in enumerate(all_shifts, start=1):
-            color = "lightgray" if row % 2 == 0 else "white"  # Alternate row colors
-            ttk.Label(scrollable_frame, text=shift_id, background=color, padding=5).grid(row=row, column=0)
-            ttk.Label(scrollable_frame, text=date, background=color, padding=5).grid(row=row, column=1)
-            ttk.Label(scrollable_frame, text=shift_type, background=color, padding=5).grid(row=row, column=2)
-            ttk.Label(scrollable_frame, text=f"Nurse {nurse_id}", background=color, padding=5).grid(row=row, column=3)
-
-        # Add "Export to PDF" button
-        export_button = ttk.Button(root, text="Export Schedule to PDF", command=lambda: export_schedule_to_pdf(schedule))
-        export_button.pack(pady=20)
-
-        # Pack everything
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+    if splash_seconds:
+        # Add an opening screen (splash screen)
+        splash_frame = tk.Frame(root)
+        splash_frame.pack(fill=tk.BOTH, expand=True)
+
+        splash_label = tk.Label(splash_frame, text="Welcome to Nurse Scheduling System", font=("Arial", 18, "bold"))
+        splash_label.pack(pady=50)
+
+        def close_splash():
+            splash_frame.destroy()
+            display_schedule_table()  # Proceed to the main schedule
+
+        root.after(int(splash_seconds * 1000), close_splash)
+    else:
+        display_schedule_table()
 
     # Start the Tkinter event loop
     root.mainloop()
@@ -5,15 +5,20 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import necessary modules
+import data_handling.data_loader as data_loader
 from data_handling.database_setup import setup_database
 from scheduling_algorithms.genetic_algorithm import genetic_algorithm
 from models.schedule import Schedule
+from data_handling.schedule_store import save_schedule
+from evaluation.fitness_function import evaluate_schedule
 from gui import display_schedule  # Import the GUI function
 
 def main():
-    # Step 1: Initialize the database (if not already done)
-    print("🚀 Setting up the database...")
-    setup_database()
+    # Step 1: Initialize the database (if not already done). Rebuilding it
+    # would also drop the saved schedule versions, so an existing one is kept.
+    if not os.path.exists(data_loader.DB_PATH):
+        print("🚀 Setting up the database...")
+        setup_database()
 
     # Step 2: Run the genetic algorithm
     print("🚀 Running the genetic algorithm...")
@@ -25,6 +30,10 @@ def main():
         print("📅 Final Optimized Schedule:")
         final_schedule.display_schedule()  # Keep CLI output
 
+        # Write the result back so it can be reloaded with load_schedule("latest") or cli.py --load-version latest
+        save_schedule(final_schedule, name="latest", fitness=evaluate_schedule(final_schedule))
+        print("💾 Schedule saved as version 'latest'.")
+
         # Step 4: Launch GUI to visualize the schedule
         print("🖥️ Launching GUI...")
         display_schedule(final_schedule)  # Show the schedule in a GUI
@@ -0,0 +1,138 @@
+# models/availability.py
+
+from datetime import datetime
+from functools import lru_cache
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+WEEKDAY_NUMBERS = {day: i for i, day in enumerate(WEEKDAYS)}
+
+SHIFT_TYPES = ("Morning", "Afternoon", "Night")  # Same as the shifts table CHECK constraint
+SHIFT_TYPE_BITS = {shift_type: 1 << i for i, shift_type in enumerate(SHIFT_TYPES)}
+ALL_SHIFT_TYPES = (1 << len(SHIFT_TYPES)) - 1  # "Flexible" or no shift type given
+
+
+@lru_cache(maxsize=None)
+def weekday_of(date):
+    """
+    Returns the weekday number (Mon=0, ..., Sun=6) of a "YYYY-MM-DD" date.
+    """
+    return datetime.strptime(date, "%Y-%m-%d").weekday()
+
+
+@lru_cache(maxsize=None)
+def parse_day_range(day_range):
+    """
+    Returns the weekday numbers covered by "Mon", "Mon-Fri" or a wrapping range like "Fri-Mon".
+    Unknown day names give an empty tuple.
+    """
+    if "-" not in day_range:
+        day = WEEKDAY_NUMBERS.get(day_range.strip())
+        return () if day is None else (day,)
+
+    start_day, end_day = (part.strip() for part in day_range.split("-", 1))
+    start = WEEKDAY_NUMBERS.get(start_day)
+    end = WEEKDAY_NUMBERS.get(end_day)
+    if start is None or end is None:
+        return ()
+
+    return tuple((start + offset) % 7 for offset in range((end - start) % 7 + 1))
+
+
+@lru_cache(maxsize=None)
+def parse_availability(availability):
+    """
+    Parses an availability string such as "Mon-Fri (Morning), Sat-Sun (Flexible)".
+
+    Days listed without a shift type take the type of the next group that has one,
+    so "Mon, Wed, Fri (Morning)" means Morning on all three days. "Flexible", or no
+    type at all, allows every shift type. Labels that are not shift types
+    (e.g. "Evening") allow nothing.
+    :return: A tuple of 7 bitmasks (Mon..Sun) over SHIFT_TYPE_BITS.
+    """
+    masks = [0] * 7
+    pending_days = []
+
+    for slot in availability.split(","):
+        slot = slot.strip()
+        if not slot:
+            continue
+
+        if "(" in slot and ")" in slot:
+            day_range, label = slot.split("(", 1)
+            label = label.replace(")", "").strip()
+            pending_days.extend(parse_day_range(day_range.strip()))
+
+            mask = ALL_SHIFT_TYPES if label == "Flexible" else SHIFT_TYPE_BITS.get(label, 0)
+            for day in pending_days:
+                masks[day] |= mask
+            pending_days = []
+        else:
+            pending_days.extend(parse_day_range(slot))
+
+    for day in pending_days:
+        masks[day] |= ALL_SHIFT_TYPES
+
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def parse_preferences(preferred_shifts):
+    """
+    Returns the bitmask of shift types named in a preferred_shifts string.
+    Uses the same substring test as check_nurse_preferences.
+    """
+    mask = 0
+    for shift_type, bit in SHIFT_TYPE_BITS.items():
+        if shift_type in preferred_shifts:
+            mask |= bit
+    return mask
+
+
+def is_available_for(availability, date, shift_type):
+    """
+    Checks an availability string against a "YYYY-MM-DD" date and shift type.
+    Parsing is cached, so repeated checks on the same strings are O(1).
+    """
+    return bool(parse_availability(availability)[weekday_of(date)] & SHIFT_TYPE_BITS.get(shift_type, 0))
+
+
+class AvailabilityIndex:
+    """
+    Nurse x weekday x shift-type availability, parsed once for a list of nurses.
+
+    Answers "which nurses can work this shift" with a single lookup.
+    """
+
+    def __init__(self, nurses):
+        """
+        :param nurses: Nurse rows as returned by fetch_nurses().
+        """
+        self.masks = tuple(parse_availability(nurse["availability"]) for nurse in nurses)
+        self.preferences = tuple(parse_preferences(nurse["preferred_shifts"]) for nurse in nurses)
+
+        # (weekday, shift type) -> nurse indices, for both plain and preferred availability
+        self._available = {}
+        self._preferred = {}
+        for day in range(7):
+            for shift_type, bit in SHIFT_TYPE_BITS.items():
+                available = tuple(i for i, masks in enumerate(self.masks) if masks[day] & bit)
+                self._available[day, shift_type] = available
+                self._preferred[day, shift_type] = tuple(i for i in available if self.preferences[i] & bit)
+
+    def is_available(self, nurse_idx, weekday, shift_type):
+        """Checks whether a nurse can work a shift type on a weekday."""
+        return bool(self.masks[nurse_idx][weekday] & SHIFT_TYPE_BITS.get(shift_type, 0))
+
+    def prefers(self, nurse_idx, shift_type):
+        """Checks whether a nurse prefers a shift type."""
+        return bool(self.preferences[nurse_idx] & SHIFT_TYPE_BITS.get(shift_type, 0))
+
+    def nurses_for(self, date, shift_type, preferred_only=False):
+        """
+        Returns the indices of the nurses who can work a shift.
+        :param date: The date of the shift (format: "YYYY-MM-DD").
+        :param shift_type: The type of shift (e.g., "Morning", "Afternoon", "Night").
+        :param preferred_only: Only return nurses who also prefer the shift type.
+        """
+        lookup = self._preferred if preferred_only else self._available
+        return lookup.get((weekday_of(date), shift_type), ())
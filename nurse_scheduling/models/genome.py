@@ -0,0 +1,131 @@
+# models/genome.py
+
+import sys
+import os
+from array import array
+from hashlib import blake2b
+
+# Add the project root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from data_handling.data_loader import fetch_nurses, fetch_shifts, iter_shifts
+from constraints.constraints import SHIFT_HOURS, compile_shift
+from models.schedule import Schedule
+from models.availability import AvailabilityIndex
+
+UNASSIGNED = -1  # Genome slot value for a shift with no nurse
+
+
+class ScheduleTables:
+    """
+    Read-only nurse and shift tables shared by every genome in a run.
+
+    A genome is an ``array("i")`` with one slot per shift (in ``shifts`` order)
+    holding the index of the assigned nurse in ``nurses``, or UNASSIGNED.
+    Everything the algorithms need about a shift is precomputed here once,
+    so individuals only carry the compact array.
+    """
+
+    def __init__(self, nurses, shifts):
+        """
+        :param nurses: Nurse rows as returned by fetch_nurses().
+        :param shifts: Shift rows as returned by fetch_shifts().
+        """
+        self.nurses = tuple(nurses)
+        self.shifts = tuple(shifts)
+        self.num_nurses = len(self.nurses)
+        self.num_shifts = len(self.shifts)
+
+        self.nurse_ids = tuple(nurse["nurse_id"] for nurse in self.nurses)
+        self.shift_ids = tuple(shift["shift_id"] for shift in self.shifts)
+        self.nurse_index = {nurse_id: i for i, nurse_id in enumerate(self.nurse_ids)}
+        self.shift_index = {shift_id: i for i, shift_id in enumerate(self.shift_ids)}
+
+        # Identifies this instance's data, e.g. for fitness cache keys
+        rows = [tuple(row.items()) for row in self.nurses] + [tuple(row.items()) for row in self.shifts]
+        self.fingerprint = blake2b(repr(rows).encode(), digest_size=16).digest()
+
+        # Per-shift attributes, compiled once: (start hour, end hour, ISO week, day ordinal)
+        self.shift_types = tuple(shift["shift_type"] for shift in self.shifts)
+        self.shift_timeline = tuple(compile_shift(shift["date"], shift["shift_type"]) for shift in self.shifts)
+        self.shift_starts = tuple(entry[0] for entry in self.shift_timeline)
+        self.shift_ends = tuple(entry[1] for entry in self.shift_timeline)
+        self.shift_weeks = tuple(entry[2] for entry in self.shift_timeline)
+        self.shift_days = tuple(entry[3] for entry in self.shift_timeline)
+        self.shift_hours = tuple(SHIFT_HOURS.get(shift_type, 0) for shift_type in self.shift_types)
+
+        # Shift types each nurse prefers (same substring test as check_nurse_preferences)
+        shift_type_names = set(self.shift_types)
+        self.preferred_types = tuple(
+            frozenset(t for t in shift_type_names if t in nurse["preferred_shifts"])
+            for nurse in self.nurses
+        )
+
+        # Nurses who can work each shift, looked up once from the availability index
+        self.availability = AvailabilityIndex(self.nurses)
+        self.eligible_nurses = tuple(
+            self.availability.nurses_for(shift["date"], shift["shift_type"]) for shift in self.shifts
+        )
+
+    def __repr__(self):
+        return f"ScheduleTables with {self.num_nurses} nurses and {self.num_shifts} shifts"
+
+
+def load_tables(start_date=None, end_date=None, wards=None, shift_types=None):
+    """
+    Loads the nurse and shift tables from the database.
+    With no filters the cached snapshot is used; otherwise only the shifts in
+    the planning window (and wards/shift types) are read, straight from SQL.
+    """
+    if start_date is None and end_date is None and wards is None and shift_types is None:
+        return ScheduleTables(fetch_nurses(), fetch_shifts())
+    return ScheduleTables(fetch_nurses(), iter_shifts(start_date, end_date, wards, shift_types))
+
+
+def empty_genome(tables):
+    """Returns a genome with every shift unassigned."""
+    return array("i", [UNASSIGNED]) * tables.num_shifts
+
+
+def genome_nurse_shifts(genome, tables):
+    """
+    Groups the genome by nurse.
+    :return: A list with, for each nurse index, the list of its shift indices.
+    """
+    nurse_shifts = [[] for _ in range(tables.num_nurses)]
+    for shift_idx, nurse_idx in enumerate(genome):
+        if nurse_idx != UNASSIGNED:
+            nurse_shifts[nurse_idx].append(shift_idx)
+    return nurse_shifts
+
+
+def genome_from_assignments(assignments, tables):
+    """
+    Converts a nurse_id -> [Shift] dictionary (e.g. from greedy_initialization) into a genome.
+    If a shift appears under several nurses, the first one wins.
+    """
+    genome = empty_genome(tables)
+    for nurse_id, shifts in assignments.items():
+        nurse_idx = tables.nurse_index[nurse_id]
+        for shift in shifts:
+            shift_idx = tables.shift_index[shift.shift_id]
+            if genome[shift_idx] == UNASSIGNED:
+                genome[shift_idx] = nurse_idx
+    return genome
+
+
+def genome_to_schedule(genome, tables):
+    """Builds a full Schedule object from a genome."""
+    schedule = Schedule()
+    schedule.assignments = {nurse_id: [] for nurse_id in tables.nurse_ids}
+
+    for shift in schedule.shifts:
+        shift.assigned_nurse = None  # Drop any assignment saved in the database (see save_schedule)
+        shift_idx = tables.shift_index.get(shift.shift_id)
+        if shift_idx is None or genome[shift_idx] == UNASSIGNED:
+            continue
+        nurse_id = tables.nurse_ids[genome[shift_idx]]
+        shift.assigned_nurse = nurse_id
+        schedule.assignments[nurse_id].append(shift)
+
+    return schedule
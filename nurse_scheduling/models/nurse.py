@@ -8,6 +8,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Now you can import from the data_loader module
 from data_handling.data_loader import fetch_nurses  # ✅ Use the data loader instead of direct DB access
+from models.availability import parse_availability, weekday_of, SHIFT_TYPE_BITS
 
 class Nurse:
     def __init__(self, nurse_id, name, age, availability, preferred_shifts):
@@ -16,20 +17,19 @@ class Nurse:
         self.age = age
         self.availability = availability
         self.preferred_shifts = preferred_shifts
+        self.availability_masks = parse_availability(availability)  # ✅ Parsed once (Mon..Sun shift-type bitmasks)
 
     def is_available(self, date, shift_type):
         """
         Check if the nurse is available for the given date and shift type.
-        :param date: The date of the shift (format: "YYYY-MM-DD").
+        :param date: The date of the shift (format: "YYYY-MM-DD", or a date object).
         :param shift_type: The type of shift (e.g., "Morning", "Afternoon", "Night").
         :return: True if the nurse is available, False otherwise.
         """
-        # Parse the availability string to check if the nurse is available on the given date
-        available_days = self.availability.split(", ")
-        shift_day = date.strftime("%a")  # Extract day of the week (e.g., "Mon", "Tue")
+        weekday = weekday_of(date) if isinstance(date, str) else date.weekday()
 
         # Check if the nurse is available on the given day and prefers the shift type
-        if shift_day in available_days and shift_type in self.preferred_shifts:
+        if self.availability_masks[weekday] & SHIFT_TYPE_BITS.get(shift_type, 0) and shift_type in self.preferred_shifts:
             return True
         return False
 
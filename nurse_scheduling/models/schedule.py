@@ -64,9 +64,10 @@ class Schedule:
             print("⚠️ No shifts scheduled.")
             return
 
+        nurses_by_id = {nurse.nurse_id: nurse for nurse in self.nurses}  # One lookup per shift instead of a scan
         for shift in self.shifts:
             assigned_nurse_id = shift.assigned_nurse
-            assigned_nurse = next((n for n in self.nurses if n.nurse_id == assigned_nurse_id), None)
+            assigned_nurse = nurses_by_id.get(assigned_nurse_id)
             nurse_name = assigned_nurse.name if assigned_nurse else "Unassigned"
 
             print(f"Shift ID: {shift.shift_id}, Date: {shift.date}, Type: {shift.shift_type}, Assigned Nurse: {nurse_name} (ID: {assigned_nurse_id})")
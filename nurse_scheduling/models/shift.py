@@ -10,18 +10,20 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from data_handling.data_loader import fetch_shifts  # ✅ Use data_loader instead of direct DB access
 
 class Shift:
-    def __init__(self, shift_id, date, shift_type, assigned_nurse=None):
+    def __init__(self, shift_id, date, shift_type, assigned_nurse=None, ward=None):
         """
         Initialize a Shift object.
         :param shift_id: The unique ID of the shift.
         :param date: The date of the shift (format: "YYYY-MM-DD").
         :param shift_type: The type of shift (e.g., "Morning", "Afternoon", "Night").
         :param assigned_nurse: The ID of the nurse assigned to the shift (default: None).
+        :param ward: The ward the shift belongs to (default: None).
         """
         self.shift_id = shift_id
         self.date = date
         self.shift_type = shift_type
         self.assigned_nurse = assigned_nurse  # Can be None if not assigned
+        self.ward = ward
 
     @staticmethod
     def fetch_all_shifts():
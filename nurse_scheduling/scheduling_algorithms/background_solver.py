@@ -0,0 +1,79 @@
+# scheduling_algorithms/background_solver.py
+
+import queue
+import sys
+import os
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation.instrumentation import GAInstrumentation
+from scheduling_algorithms.genetic_algorithm import genetic_algorithm
+
+
+class BackgroundSolver:
+    """
+    Runs genetic_algorithm() on a daemon thread so a GUI stays responsive.
+
+    Progress comes back through a queue as (kind, data) events, read with poll():
+    ("progress", {"generation", "best_fitness", "evaluations", "seconds"}) after
+    every generation, then ("done", Schedule) or ("error", exception).
+    cancel() stops the run after the current generation; the "done" event then
+    carries the best schedule found so far.
+    """
+
+    def __init__(self, **options):
+        """
+        :param options: Keyword arguments for genetic_algorithm() (e.g. seed, time_budget).
+        """
+        self.options = options
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = None
+        self.evaluations = 0
+
+    def start(self):
+        """Starts the solve. A solver can only be started once."""
+        if self.thread is not None:
+            raise RuntimeError("This solver has already been started.")
+        self.thread = threading.Thread(target=self._run, name="BackgroundSolver", daemon=True)
+        self.thread.start()
+        return self
+
+    def _run(self):
+        # Constraint timing wraps a module-level function, so leave it off in a shared process
+        instrumentation = GAInstrumentation(time_constraints=False)
+        instrumentation.add_hook("generation_end", self._on_generation_end)
+        try:
+            schedule = genetic_algorithm(instrumentation=instrumentation, stop_event=self.cancel_event,
+                                         verbose=False, **self.options)
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", schedule))
+
+    def _on_generation_end(self, instrumentation, **record):
+        self.evaluations += record["evaluations"]
+        self.events.put(("progress", {
+            "generation": record["generation"],
+            "best_fitness": record["best_fitness"],
+            "evaluations": self.evaluations,
+            "seconds": sum(r["seconds"] for r in instrumentation.records),
+        }))
+
+    def cancel(self):
+        """Asks the run to stop after the current generation."""
+        self.cancel_event.set()
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def poll(self):
+        """Returns every event queued since the last call, without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
@@ -0,0 +1,106 @@
+# scheduling_algorithms/constructive_heuristic.py
+
+import heapq
+import logging
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from constraints.compiled_model import NurseTimeline
+from models.genome import ScheduleTables, empty_genome, load_tables, genome_to_schedule
+from models.shift import Shift
+
+logger = logging.getLogger(__name__)
+
+
+def least_loaded_nurse(candidates, loads, shift_idx, tables):
+    """
+    Pops nurses from a heap ordered by hours worked (preferring nurses who like the
+    shift type on ties) until one can take the shift.
+    :return: The nurse index, or None if no candidate can take it.
+    """
+    shift_type = tables.shift_types[shift_idx]
+    heap = [
+        (loads[nurse_idx].hours, shift_type not in tables.preferred_types[nurse_idx], nurse_idx)
+        for nurse_idx in candidates
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        _, _, nurse_idx = heapq.heappop(heap)
+        if loads[nurse_idx].can_insert(shift_idx):
+            return nurse_idx
+    return None
+
+
+def choose_nurse(shift_idx, loads, tables):
+    """
+    Picks the least-loaded available nurse who stays within the hours,
+    consecutive-day and rest limits. If no available nurse can take the shift,
+    any nurse within the limits is used, and as a last resort the least-loaded
+    available nurse.
+    :return: (nurse index, whether the limits were kept)
+    """
+    eligible = tables.eligible_nurses[shift_idx]
+    nurse_idx = least_loaded_nurse(eligible, loads, shift_idx, tables)
+    if nurse_idx is not None:
+        return nurse_idx, True
+
+    all_nurses = range(tables.num_nurses)
+    nurse_idx = least_loaded_nurse(all_nurses, loads, shift_idx, tables)
+    within_limits = nurse_idx is not None
+    if not within_limits:
+        # Nobody fits the limits: keep the shift covered and let the search repair it
+        pool = eligible or all_nurses
+        nurse_idx = min(pool, key=lambda i: loads[i].hours)
+    logger.debug("Shift %s has no available nurse within the limits; using nurse %s",
+                 tables.shift_ids[shift_idx], tables.nurse_ids[nurse_idx])
+    return nurse_idx, within_limits
+
+
+def constructive_initialization(tables):
+    """
+    Builds a genome with exactly one nurse per shift.
+
+    Shifts are filled most-constrained-first (fewest available nurses, then date),
+    each going to the nurse picked by choose_nurse().
+    """
+    genome = empty_genome(tables)
+    loads = [NurseTimeline(tables) for _ in range(tables.num_nurses)]
+
+    order = sorted(range(tables.num_shifts),
+                   key=lambda shift_idx: (len(tables.eligible_nurses[shift_idx]), tables.shift_days[shift_idx]))
+    relaxed = 0
+
+    for shift_idx in order:
+        nurse_idx, within_limits = choose_nurse(shift_idx, loads, tables)
+        relaxed += not within_limits
+        genome[shift_idx] = nurse_idx
+        loads[nurse_idx].add(shift_idx)
+
+    if relaxed:
+        logger.info("%d shifts were assigned beyond the hours/rest limits", relaxed)
+    return genome
+
+
+def constructive_schedule(nurses, shifts):
+    """
+    Same output as greedy_initialization (nurse_id -> [Shift objects]), built by
+    constructive_initialization.
+    """
+    tables = ScheduleTables(nurses, shifts)
+    genome = constructive_initialization(tables)
+
+    schedule = {nurse_id: [] for nurse_id in tables.nurse_ids}
+    for shift_idx, nurse_idx in enumerate(genome):
+        shift_data = tables.shifts[shift_idx]
+        nurse_id = tables.nurse_ids[nurse_idx]
+        schedule[nurse_id].append(Shift(shift_data["shift_id"], shift_data["date"], shift_data["shift_type"], nurse_id))
+    return schedule
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if "--debug" in sys.argv else logging.INFO)
+    tables = load_tables()
+    genome_to_schedule(constructive_initialization(tables), tables).display_schedule()
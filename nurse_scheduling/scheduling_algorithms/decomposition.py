@@ -0,0 +1,129 @@
+# scheduling_algorithms/decomposition.py
+
+import random
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scheduling_algorithms import genetic_algorithm as ga
+from scheduling_algorithms.rescheduling import repair_genome
+from constraints.constraints import MAX_CONSECUTIVE_SHIFTS, check_genome_constraints
+from evaluation.fitness_function import evaluate_genome
+from models.genome import ScheduleTables, empty_genome, genome_nurse_shifts, genome_to_schedule, load_tables
+
+# Decomposition Parameters
+PARTITIONS = ("week", "ward")
+BOUNDARY_DAYS = 1  # Days either side of a boundary that are always re-optimised
+BOUNDARY_REPAIR_TIME = 2.0  # Seconds for stitching the pieces back together
+
+
+def partition_shifts(tables, by="week"):
+    """
+    Splits the shifts into independent sub-problems.
+    :param by: "week" (Monday to Sunday) or "ward" (needs a ward column on the shifts).
+    :return: A list of shift index lists, in date order.
+    """
+    if by not in PARTITIONS:
+        raise ValueError(f"Unknown partition '{by}'. Choose from {PARTITIONS}.")
+
+    if by == "week":
+        # Day ordinal 1 (0001-01-01) is a Monday, so this groups Monday to Sunday
+        keys = [(day - 1) // 7 for day in tables.shift_days]
+    else:
+        if tables.shifts and "ward" not in tables.shifts[0]:
+            raise ValueError("The shifts have no ward column to partition on.")
+        keys = [shift["ward"] for shift in tables.shifts]
+
+    parts = {}
+    for shift_idx, key in enumerate(keys):
+        parts.setdefault(key, []).append(shift_idx)
+    return sorted(parts.values(), key=lambda part: tables.shift_days[part[0]])
+
+
+def _solve_part(part_tables, seed):
+    """Runs the GA on one sub-problem in a worker process and returns its best genome."""
+    random.seed(seed)
+    # _evolve rather than genetic_algorithm(), which would build a Schedule from the genome
+    return ga._evolve(part_tables, pool=None, batch_evaluator=None, memetic=False, cache=None, verbose=False)
+
+
+def boundary_shifts(genome, tables, parts):
+    """
+    Picks the shifts the stitching repair may change: everything within
+    BOUNDARY_DAYS of a week boundary, plus the shifts near a boundary of
+    nurses who now break a constraint across it.
+    """
+    boundaries = sorted({tables.shift_days[part[0]] for part in parts[1:]})
+    if not boundaries:
+        return []
+
+    def distance(shift_idx):
+        day = tables.shift_days[shift_idx]
+        return min(min(abs(day - boundary), abs(day - (boundary - 1))) for boundary in boundaries)
+
+    free = {shift_idx for shift_idx in range(tables.num_shifts) if distance(shift_idx) < BOUNDARY_DAYS}
+    for shift_indices in genome_nurse_shifts(genome, tables):
+        if not all(check_genome_constraints(shift_indices, tables)):
+            free.update(s for s in shift_indices if distance(s) < MAX_CONSECUTIVE_SHIFTS)
+    return sorted(free)
+
+
+def conflicting_shifts(genome, tables):
+    """Returns every shift of the nurses who break a constraint."""
+    free = []
+    for shift_indices in genome_nurse_shifts(genome, tables):
+        if not all(check_genome_constraints(shift_indices, tables)):
+            free.extend(shift_indices)
+    return sorted(free)
+
+
+def decomposed_genetic_algorithm(partition="week", workers=None, seed=None,
+                                 repair_time=BOUNDARY_REPAIR_TIME, tables=None):
+    """
+    Solves a long or multi-ward horizon as independent sub-problems.
+
+    Each week (or ward) gets its own GA run in a process pool. The pieces are
+    stitched into one genome, and the shifts around each boundary are then
+    re-optimised so consecutive days, rest periods and weekly hours that span
+    two pieces are fixed.
+    :param partition: "week" or "ward".
+    :param workers: Number of processes (default: one per CPU).
+    :param seed: Optional random seed for reproducible runs.
+    :param repair_time: Seconds spent repairing the boundaries.
+    :param tables: ScheduleTables to solve (default: everything in the database).
+    :return: The stitched Schedule.
+    """
+    tables = tables or load_tables()
+    parts = partition_shifts(tables, partition)
+    print(f"🧩 Running Decomposed Genetic Algorithm on {len(parts)} {partition} sub-problems...")
+
+    rng = random.Random(seed)
+    part_tables = [ScheduleTables(tables.nurses, [tables.shifts[i] for i in part]) for part in parts]
+    seeds = [rng.randrange(2 ** 32) for _ in parts]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        part_genomes = list(pool.map(_solve_part, part_tables, seeds))
+
+    genome = empty_genome(tables)
+    for part, part_genome in zip(parts, part_genomes):
+        for part_idx, shift_idx in enumerate(part):
+            genome[shift_idx] = part_genome[part_idx]
+    print(f"✅ Stitched fitness: {evaluate_genome(genome, tables)}")
+
+    # Weeks only meet at their boundaries; wards share nurses on every day
+    if partition == "week":
+        free_shifts = boundary_shifts(genome, tables, parts)
+    else:
+        free_shifts = conflicting_shifts(genome, tables)
+    repair_genome(genome, tables, free_shifts, set(), empty_genome(tables), repair_time, rng)
+    print(f"✅ Fitness after boundary repair: {evaluate_genome(genome, tables)}")
+
+    return genome_to_schedule(genome, tables)
+
+
+if __name__ == "__main__":
+    final_schedule = decomposed_genetic_algorithm()
+    print("✅ Decomposed Genetic Algorithm Finished!")
+    final_schedule.display_schedule()
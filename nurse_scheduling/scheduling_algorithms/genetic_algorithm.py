@@ -1,21 +1,30 @@
 # scheduling_algorithms/genetic_algorithm.py
 
+import contextlib
+import itertools
 import random
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from scheduling_algorithms.greedy_initialization import greedy_initialization
-from evaluation.fitness_function import evaluate_schedule
-from constraints.constraints import validate_schedule
-from models.shift import Shift
-from models.schedule import Schedule
-
-try:
-    from data_loader import fetch_nurses, fetch_shifts
-except ImportError:
-    print("⚠️ WARNING: data_loader module not found. Make sure it exists!")
+from scheduling_algorithms.constructive_heuristic import constructive_initialization
+from evaluation.fitness_function import evaluate_genome
+from evaluation.vectorized_fitness import VectorizedEvaluator
+from evaluation.fitness_cache import shared_fitness_cache
+from evaluation.instrumentation import phase
+from scheduling_algorithms.local_search import tabu_search
+from scheduling_algorithms.warm_start import warm_start_population, preference_bound
+from scheduling_algorithms.operators import uniform_crossover, week_block_crossover, eligible_mutation, repair
+from models.genome import (
+    load_tables,
+    empty_genome,
+    genome_nurse_shifts,
+    genome_to_schedule,
+    UNASSIGNED
+)
 
 # Genetic Algorithm Parameters
 POPULATION_SIZE = 20
@@ -23,39 +32,97 @@ MUTATION_RATE = 0.2
 GENERATIONS = 100
 FITNESS_THRESHOLD = 500
 STAGNANT_LIMIT = 15
+EVALUATION_WORKERS = 1  # More than 1 scores the population in a process pool
+EVALUATORS = ("python", "numpy")  # Per-genome Python scoring or the batched NumPy kernel
+MEMETIC_ITERATIONS = 20  # Tabu search iterations per child in memetic mode
+SEEDINGS = ("constructive", "matching")  # Initial population: heuristic + random, or matching warm start + variants
+
+_worker_tables = None  # Tables loaded once in each evaluation worker process
+
+
+def initialize_population(tables, population_size=None, seeding="constructive"):
+    """
+    Creates an initial population of genomes using both constructive and random methods,
+    or from the matching warm start and perturbed variants of it (see warm_start.py).
+    :param population_size: Number of genomes (default: POPULATION_SIZE).
+    :param seeding: "constructive" or "matching".
+    """
+    population_size = population_size or POPULATION_SIZE
+    if seeding == "matching":
+        return warm_start_population(tables, population_size)
+    population = []
 
+    # The constructive heuristic is deterministic, so build it once and copy it
+    seed_genome = constructive_initialization(tables)
+    for _ in range(population_size // 2):
+        population.append(seed_genome[:])
 
-def initialize_population():
-    """Creates an initial population of schedules using both greedy and random methods."""
-    nurses = fetch_nurses()
-    shifts = fetch_shifts()
-    population = []
+    for _ in range(population_size - population_size // 2):
+        genome = empty_genome(tables)
 
-    for _ in range(POPULATION_SIZE // 2):
-        schedule = Schedule()
-        schedule.assignments = greedy_initialization(nurses, shifts)
-        population.append(schedule)
+        for shift_idx, available_nurses in enumerate(tables.eligible_nurses):
+            genome[shift_idx] = random.choice(available_nurses) if available_nurses else random.randrange(tables.num_nurses)
 
-    for _ in range(POPULATION_SIZE // 2):
-        schedule = Schedule()
-        random_schedule = {nurse["nurse_id"]: [] for nurse in nurses}
+        population.append(genome)
 
-        for shift in shifts:
-            available_nurses = [nurse for nurse in nurses if shift["date"] in nurse["availability"]]
-            nurse = random.choice(available_nurses) if available_nurses else random.choice(nurses)
+    return population
 
-            shift_obj = Shift(shift["shift_id"], shift["date"], shift["shift_type"], nurse["nurse_id"])
-            random_schedule[nurse["nurse_id"]].append(shift_obj)
 
-        schedule.assignments = random_schedule
-        population.append(schedule)
+def _init_evaluation_worker(tables):
+    """Stores the shared tables in a worker process, once per worker."""
+    global _worker_tables
+    _worker_tables = tables
 
-    return population
 
+def _evaluate_in_worker(genome):
+    """Scores one genome inside a worker process."""
+    return evaluate_genome(genome, _worker_tables)
+
+
+def create_evaluation_pool(tables, workers):
+    """
+    Starts a process pool for evaluate_population. Each worker receives the
+    tables once; afterwards only the compact genomes are sent to it.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_evaluation_worker,
+        initargs=(tables,)
+    )
+
+
+def _score_genomes(genomes, tables, pool=None, batch_evaluator=None):
+    """Scores genomes with the batch evaluator, the process pool or in-process, in input order."""
+    if batch_evaluator is not None:
+        return batch_evaluator(genomes)
+
+    if pool is None:
+        return [evaluate_genome(genome, tables) for genome in genomes]
+
+    chunksize = max(1, len(genomes) // (4 * (os.cpu_count() or 1)))
+    return list(pool.map(_evaluate_in_worker, genomes, chunksize=chunksize))
+
+
+def evaluate_population(population, tables, pool=None, batch_evaluator=None, cache=None):
+    """
+    Evaluates each genome.
+    :param pool: Optional pool from create_evaluation_pool. Scores come back in input order.
+    :param batch_evaluator: Optional VectorizedEvaluator that scores the whole population at once.
+    :param cache: Optional FitnessCache; only genomes it hasn't seen are scored.
+    :return: (list of (genome, fitness score), number of genomes actually scored, i.e. cache misses).
+    """
+    if cache is None:
+        return list(zip(population, _score_genomes(population, tables, pool, batch_evaluator))), len(population)
+
+    scores = [cache.get(genome, tables) for genome in population]
+    missing = [i for i, score in enumerate(scores) if score is None]
+    if missing:
+        new_scores = _score_genomes([population[i] for i in missing], tables, pool, batch_evaluator)
+        for i, score in zip(missing, new_scores):
+            scores[i] = score
+            cache.put(population[i], tables, score)
 
-def evaluate_population(population):
-    """Evaluates each schedule and returns a list of (schedule, fitness score)."""
-    return [(schedule, evaluate_schedule(schedule)) for schedule in population]
+    return list(zip(population, scores)), len(missing)
 
 
 def selection(population_scores):
@@ -67,120 +134,240 @@ def selection(population_scores):
     ]
 
 
-def crossover(parent1, parent2):
-    """Creates a child schedule by merging shifts from both parents while ensuring uniqueness."""
-    child = Schedule()
-    assigned_shifts = set()
+def crossover(parent1, parent2, tables):
+    """Creates a child genome from parent1's assignments, filling its gaps from parent2 and then at random."""
+    child = parent1[:]
 
-    for nurse_id in parent1.assignments:
-        child.assignments[nurse_id] = []
-
-    for nurse_id, shifts in parent1.assignments.items():
-        for shift in shifts:
-            if shift.shift_id not in assigned_shifts:
-                child.assignments[nurse_id].append(shift)
-                assigned_shifts.add(shift.shift_id)
-
-    for nurse_id, shifts in parent2.assignments.items():
-        for shift in shifts:
-            if shift.shift_id not in assigned_shifts:
-                child.assignments[nurse_id].append(shift)
-                assigned_shifts.add(shift.shift_id)
-
-    all_shifts = {shift["shift_id"] for shift in fetch_shifts()}
-    missing_shifts = list(all_shifts - assigned_shifts)
-
-    nurse_ids = list(child.assignments.keys())
-    for shift_id in missing_shifts:
-        shift_data = next(shift for shift in fetch_shifts() if shift["shift_id"] == shift_id)
-        random_nurse = random.choice(nurse_ids)
-        shift_obj = Shift(shift_data["shift_id"], shift_data["date"], shift_data["shift_type"], random_nurse)
-        child.assignments[random_nurse].append(shift_obj)
+    for shift_idx, nurse_idx in enumerate(child):
+        if nurse_idx == UNASSIGNED:
+            nurse_idx = parent2[shift_idx]
+            if nurse_idx == UNASSIGNED:
+                nurse_idx = random.randrange(tables.num_nurses)
+            child[shift_idx] = nurse_idx
 
     return child
 
 
-def mutate(schedule):
-    """Mutates the schedule by swapping shifts between nurses."""
-    nurse_list = list(schedule.assignments.keys())
+def mutate(genome, tables):
+    """Mutates the genome by swapping shifts between nurses."""
+    nurse_shifts = genome_nurse_shifts(genome, tables)
 
-    for _ in range(int(len(nurse_list) * MUTATION_RATE)):
-        if len(nurse_list) < 2:
+    for _ in range(int(tables.num_nurses * MUTATION_RATE)):
+        if tables.num_nurses < 2:
             break
 
-        nurse1, nurse2 = random.sample(nurse_list, 2)
+        nurse1, nurse2 = random.sample(range(tables.num_nurses), 2)
 
-        if schedule.assignments[nurse1] and schedule.assignments[nurse2]:
-            shift1 = random.choice(schedule.assignments[nurse1])
-            shift2 = random.choice(schedule.assignments[nurse2])
+        if nurse_shifts[nurse1] and nurse_shifts[nurse2]:
+            shift1 = random.choice(nurse_shifts[nurse1])
+            shift2 = random.choice(nurse_shifts[nurse2])
 
-            schedule.assignments[nurse1].remove(shift1)
-            schedule.assignments[nurse2].remove(shift2)
+            nurse_shifts[nurse1].remove(shift1)
+            nurse_shifts[nurse2].remove(shift2)
 
-            schedule.assignments[nurse1].append(shift2)
-            schedule.assignments[nurse2].append(shift1)
+            nurse_shifts[nurse1].append(shift2)
+            nurse_shifts[nurse2].append(shift1)
 
-    return schedule
+            genome[shift1] = nurse2
+            genome[shift2] = nurse1
 
+    return genome
 
-def deduplicate_schedule(schedule):
-    """Ensures the final schedule has 42 unique shifts."""
-    all_shifts = set()
-    for nurse_id in schedule.assignments:
-        unique_shifts = []
-        for shift in schedule.assignments[nurse_id]:
-            if shift.shift_id not in all_shifts:
-                unique_shifts.append(shift)
-                all_shifts.add(shift.shift_id)
-        schedule.assignments[nurse_id] = unique_shifts
 
-    return schedule
+# Operator set name -> (crossover, mutation); the per-shift sets keep mutations to available nurses
+OPERATORS = {
+    "classic": (crossover, mutate),
+    "uniform": (uniform_crossover, eligible_mutation),
+    "week_block": (week_block_crossover, eligible_mutation),
+}
 
 
-def genetic_algorithm():
-    """Runs the genetic algorithm to find the best nurse schedule."""
-    print("🚀 Running Genetic Algorithm...")
+def evolve_generation(population, tables, pool=None, batch_evaluator=None, memetic=False, cache=None,
+                      instrumentation=None, operators="classic", repair_children=False):
+    """
+    Runs one generation: scores the population, breeds one child from two
+    tournament winners and replaces the worst genome with it.
+    :param memetic: If True, the child is polished with tabu search before it joins.
+    :param cache: Optional FitnessCache, so unchanged genomes are not scored again.
+    :param instrumentation: Optional GAInstrumentation that times each phase.
+    :param operators: Name of the crossover/mutation pair in OPERATORS.
+    :param repair_children: Run repair() on every child before it is scored.
+    :return: The new list of (genome, fitness score).
+    """
+    crossover_operator, mutation_operator = OPERATORS[operators]
 
-    population = initialize_population()
-    population_scores = evaluate_population(population)
+    with phase(instrumentation, "evaluation"):
+        population_scores, evaluated = evaluate_population(population, tables, pool, batch_evaluator, cache)
+    if instrumentation is not None:
+        instrumentation.record_evaluations(evaluated, [score for _, score in population_scores])
 
-    best_schedule = None
+    with phase(instrumentation, "selection"):
+        parent1, parent2 = selection(population_scores)
+    with phase(instrumentation, "crossover"):
+        child = crossover_operator(parent1, parent2, tables)
+    with phase(instrumentation, "mutate"):
+        child = mutation_operator(child, tables)
+        if repair_children:
+            child = repair(child, tables)
+
+    with phase(instrumentation, "evaluation"):
+        child_evaluated = 1
+        if memetic:
+            child, child_fitness = tabu_search(child, tables, iterations=MEMETIC_ITERATIONS,
+                                               rng=random.Random(random.random()))
+            if cache is not None:
+                cache.put(child, tables, child_fitness)
+        elif cache is not None:
+            misses = cache.misses
+            child_fitness = cache.evaluate(child, tables)
+            child_evaluated = cache.misses - misses
+        else:
+            child_fitness = evaluate_genome(child, tables)
+    if instrumentation is not None:
+        instrumentation.record_evaluations(child_evaluated, [child_fitness])
+
+    population_scores.sort(key=lambda x: x[1], reverse=True)
+    population_scores[-1] = (child, child_fitness)
+
+    return population_scores
+
+
+def genetic_algorithm(workers=EVALUATION_WORKERS, seed=None, evaluator="python", memetic=False,
+                      fitness_cache=shared_fitness_cache, tables=None, instrumentation=None,
+                      population_size=None, generations=None, time_budget=None, verbose=True,
+                      stop_event=None, seeding="constructive", operators="classic", repair_children=False):
+    """
+    Runs the genetic algorithm to find the best nurse schedule.
+    :param workers: Number of processes used to evaluate the population (1 = no pool).
+    :param seed: Optional random seed; runs with the same seed give the same schedule
+                 whatever the number of workers.
+    :param evaluator: "python" (evaluate_genome per genome) or "numpy" (VectorizedEvaluator).
+    :param memetic: Polish every child with tabu search (see local_search.py).
+    :param fitness_cache: FitnessCache for scores (default: the shared cache; None disables it).
+    :param tables: ScheduleTables to solve (default: everything in the database).
+    :param instrumentation: Optional GAInstrumentation for hooks, phase timings and a trace.
+    :param population_size: Genomes per generation (default: POPULATION_SIZE).
+    :param generations: Generation limit (default: GENERATIONS, or no limit when a time_budget is given).
+    :param time_budget: Wall-clock limit in seconds; the best schedule found by then is returned.
+    :param verbose: Print progress; False keeps the run silent.
+    :param stop_event: Optional threading.Event; once set, the run stops after the current
+                       generation and returns the best schedule so far.
+    :param seeding: Initial population: "constructive" (heuristic + random genomes) or
+                    "matching" (min-cost matching warm start + perturbed variants).
+    :param operators: Crossover/mutation pair: "classic" (parent fill + nurse swaps),
+                      "uniform" or "week_block" (per-shift crossover + mutation to available nurses).
+    :param repair_children: Repair every child so each shift has one nurse who can take it.
+    """
+    if seeding not in SEEDINGS:
+        raise ValueError(f"Unknown seeding '{seeding}'. Choose from {SEEDINGS}.")
+    if operators not in OPERATORS:
+        raise ValueError(f"Unknown operators '{operators}'. Choose from {tuple(OPERATORS)}.")
+    if evaluator not in EVALUATORS:
+        raise ValueError(f"Unknown evaluator '{evaluator}'. Choose from {EVALUATORS}.")
+    if evaluator == "numpy" and workers > 1:
+        raise ValueError("The numpy evaluator scores the population in-process; use workers=1 with it.")
+
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    if generations is None and time_budget is None:
+        generations = GENERATIONS
+
+    if verbose:
+        print("🚀 Running Genetic Algorithm...")
+
+    if seed is not None:
+        random.seed(seed)
+
+    tables = tables or load_tables()
+    pool = create_evaluation_pool(tables, workers) if workers > 1 else None
+    batch_evaluator = VectorizedEvaluator(tables) if evaluator == "numpy" else None
+    if verbose and seeding == "matching":
+        print(f"🎯 Preference reward bound: {preference_bound(tables)}")
+    try:
+        run = instrumentation.running() if instrumentation is not None else contextlib.nullcontext()
+        with run:
+            best_genome = _evolve(tables, pool, batch_evaluator, memetic, fitness_cache, instrumentation,
+                                  population_size, generations, deadline, verbose, stop_event, seeding,
+                                  operators, repair_children)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if fitness_cache is not None and verbose:
+        stats = fitness_cache.stats()
+        print(f"📊 Fitness cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+
+    # Only the winner is turned into a full Schedule
+    return genome_to_schedule(best_genome, tables)
+
+
+def _evolve(tables, pool, batch_evaluator, memetic, cache, instrumentation=None,
+            population_size=None, generations=GENERATIONS, deadline=None, verbose=True, stop_event=None,
+            seeding="constructive", operators="classic", repair_children=False):
+    """
+    Runs the generation loop and returns the best genome found.
+    :param generations: Generation limit, or None to run until the deadline.
+    :param deadline: Optional time.perf_counter() value at which to stop.
+    :param stop_event: Optional threading.Event that cancels the run.
+    :param seeding: "constructive" or "matching", see initialize_population.
+    :param operators: Name of the crossover/mutation pair in OPERATORS.
+    :param repair_children: Repair every child before it is scored.
+    """
+    population = initialize_population(tables, population_size, seeding)
+
+    best_genome = None
     best_fitness = float('-inf')
     stagnant_generations = 0
+    limit = f"/{generations}" if generations is not None else ""
 
-    for generation in range(GENERATIONS):
-        print(f"⚡ Generation {generation + 1}/{GENERATIONS}")
-
-        population_scores = evaluate_population(population)
+    for generation in (range(generations) if generations is not None else itertools.count()):
+        if instrumentation is not None:
+            instrumentation.generation_start(generation + 1)
+        if verbose:
+            with phase(instrumentation, "output"):
+                print(f"⚡ Generation {generation + 1}{limit}")
 
-        parent1, parent2 = selection(population_scores)
-        child = mutate(crossover(parent1, parent2))
-
-        population_scores.sort(key=lambda x: x[1], reverse=True)
-        population_scores[-1] = (child, evaluate_schedule(child))
-
-        population = [schedule for schedule, _ in population_scores]
+        population_scores = evolve_generation(population, tables, pool, batch_evaluator, memetic, cache,
+                                              instrumentation, operators, repair_children)
+        population = [genome for genome, _ in population_scores]
 
         current_best_fitness = max(population_scores, key=lambda x: x[1])[1]
         if current_best_fitness > best_fitness:
             best_fitness = current_best_fitness
-            best_schedule = max(population_scores, key=lambda x: x[1])[0]
+            best_genome = max(population_scores, key=lambda x: x[1])[0]
             stagnant_generations = 0
+            if instrumentation is not None:
+                instrumentation.new_best(best_genome, best_fitness)
         else:
             stagnant_generations += 1
 
-        print(f"✅ Best Fitness So Far: {best_fitness}")
+        if verbose:
+            with phase(instrumentation, "output"):
+                print(f"✅ Best Fitness So Far: {best_fitness}")
+        if instrumentation is not None:
+            instrumentation.generation_end(population_scores, best_fitness)
 
         if stagnant_generations >= STAGNANT_LIMIT:
-            print("🚀 Stopping early: No improvement in recent generations.")
+            if verbose:
+                print("🚀 Stopping early: No improvement in recent generations.")
+            break
+
+        # With a time budget the run keeps improving until the deadline instead
+        if deadline is None and best_fitness >= FITNESS_THRESHOLD and generation >= 5:
+            if verbose:
+                print("🚀 Stopping early: Fitness threshold met!")
+            break
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            if verbose:
+                print("⏱️ Stopping: Time budget used up.")
             break
 
-        if best_fitness >= FITNESS_THRESHOLD and generation >= 5:
-            print("🚀 Stopping early: Fitness threshold met!")
+        if stop_event is not None and stop_event.is_set():
+            if verbose:
+                print("🛑 Stopping: Cancelled.")
             break
 
-    best_schedule = deduplicate_schedule(best_schedule)
-    return best_schedule
+    return best_genome
 
 
 if __name__ == "__main__":
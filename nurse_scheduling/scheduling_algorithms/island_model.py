@@ -0,0 +1,148 @@
+# scheduling_algorithms/island_model.py
+
+import random
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scheduling_algorithms.genetic_algorithm import (
+    initialize_population,
+    evolve_generation,
+    GENERATIONS,
+    FITNESS_THRESHOLD,
+    STAGNANT_LIMIT
+)
+from models.genome import load_tables, genome_to_schedule
+from evaluation.fitness_cache import shared_fitness_cache
+
+# Island Model Parameters
+ISLAND_COUNT = 4
+MIGRATION_INTERVAL = 5  # Generations between migrations
+MIGRANTS = 2  # Best genomes sent from each island per migration
+TOPOLOGIES = ("ring", "random")
+
+_worker_tables = None  # Tables loaded once in each island process
+
+
+def _init_island_worker(tables):
+    """Stores the shared tables in an island process, once per process."""
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _run_island_epoch(population, generations, seed):
+    """
+    Runs one island for a number of generations with the standard GA loop.
+    :return: The island's final list of (genome, fitness score).
+    """
+    random.seed(seed)
+    population_scores = []
+    for _ in range(generations):
+        population_scores = evolve_generation(population, _worker_tables, cache=shared_fitness_cache)
+        population = [genome for genome, _ in population_scores]
+    return population_scores
+
+
+def migrate(island_scores, migrants, topology, rng):
+    """
+    Sends each island's best genomes to a neighbour, replacing the neighbour's worst.
+    :param island_scores: For each island, its list of (genome, fitness score).
+    :param topology: "ring" sends to the next island, "random" to a random other island.
+    :return: The new population (list of genomes) of each island.
+    """
+    island_count = len(island_scores)
+    ranked = [sorted(scores, key=lambda x: x[1], reverse=True) for scores in island_scores]
+    emigrants = [[genome[:] for genome, _ in scores[:migrants]] for scores in ranked]
+
+    populations = [[genome for genome, _ in scores] for scores in ranked]
+    if island_count < 2:
+        return populations
+
+    for source in range(island_count):
+        if topology == "ring":
+            target = (source + 1) % island_count
+        else:
+            target = rng.choice([i for i in range(island_count) if i != source])
+
+        # Replace the target's worst genomes (the end of its ranked list)
+        replace_count = len(emigrants[source])
+        if replace_count:
+            populations[target][-replace_count:] = emigrants[source]
+
+    return populations
+
+
+def island_genetic_algorithm(islands=ISLAND_COUNT, migration_interval=MIGRATION_INTERVAL,
+                             migrants=MIGRANTS, topology="ring", workers=None, seed=None):
+    """
+    Runs several independent GA populations (islands) in parallel processes and
+    exchanges their best genomes every migration_interval generations.
+    :param islands: Number of subpopulations.
+    :param migration_interval: Generations each island runs between migrations.
+    :param migrants: How many of its best genomes each island sends per migration.
+    :param topology: "ring" or "random".
+    :param workers: Number of processes (default: one per island).
+    :param seed: Optional random seed for reproducible runs.
+    :return: The best Schedule found on any island.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology '{topology}'. Choose from {TOPOLOGIES}.")
+
+    print(f"🏝️ Running Island Genetic Algorithm with {islands} islands ({topology} topology)...")
+
+    rng = random.Random(seed)
+    if seed is not None:
+        random.seed(seed)
+
+    tables = load_tables()
+    populations = [initialize_population(tables) for _ in range(islands)]
+
+    best_genome = None
+    best_fitness = float('-inf')
+    stagnant_generations = 0
+    generation = 0
+
+    with ProcessPoolExecutor(max_workers=workers or islands, initializer=_init_island_worker,
+                             initargs=(tables,)) as pool:
+        while generation < GENERATIONS:
+            epoch_generations = min(migration_interval, GENERATIONS - generation)
+            futures = [
+                pool.submit(_run_island_epoch, population, epoch_generations, rng.randrange(2 ** 32))
+                for population in populations
+            ]
+            island_scores = [future.result() for future in futures]
+            generation += epoch_generations
+
+            island_best = [max(scores, key=lambda x: x[1]) for scores in island_scores]
+            print(f"⚡ Generation {generation}/{GENERATIONS} - island best: "
+                  + ", ".join(f"#{i + 1}: {fitness}" for i, (_, fitness) in enumerate(island_best)))
+
+            epoch_best_genome, epoch_best_fitness = max(island_best, key=lambda x: x[1])
+            if epoch_best_fitness > best_fitness:
+                best_fitness = epoch_best_fitness
+                best_genome = epoch_best_genome
+                stagnant_generations = 0
+            else:
+                stagnant_generations += epoch_generations
+
+            print(f"✅ Global Best Fitness So Far: {best_fitness}")
+
+            if stagnant_generations >= STAGNANT_LIMIT:
+                print("🚀 Stopping early: No improvement on any island in recent generations.")
+                break
+
+            if best_fitness >= FITNESS_THRESHOLD and generation >= 5:
+                print("🚀 Stopping early: Fitness threshold met!")
+                break
+
+            populations = migrate(island_scores, migrants, topology, rng)
+
+    return genome_to_schedule(best_genome, tables)
+
+
+if __name__ == "__main__":
+    final_schedule = island_genetic_algorithm()
+    print("✅ Island Genetic Algorithm Finished!")
+    final_schedule.display_schedule()
@@ -1 +1,145 @@
- # Main entry point of the program
+# scheduling_algorithms/local_search.py
+
+import random
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation.incremental_fitness import IncrementalEvaluator
+from evaluation.fitness_cache import shared_fitness_cache
+from models.genome import genome_from_assignments, genome_to_schedule, load_tables
+
+# Tabu Search Parameters
+TABU_ITERATIONS = 200
+TABU_TENURE = 10  # Iterations a (shift, nurse) pair stays tabu
+CANDIDATES_PER_ITERATION = 150  # Sampled neighbourhood size per iteration
+STAGNANT_ITERATIONS = 50  # Stop after this many iterations without a new best
+
+
+def sample_neighbourhood(evaluator, rng, candidates):
+    """
+    Samples reassign and swap moves around the current genome.
+    :return: A list of distinct moves, each ("reassign", shift_idx, nurse_idx) or ("swap", shift_a, shift_b),
+             in the order they were sampled, so seeded runs pick the same move on ties.
+    """
+    tables = evaluator.tables
+    moves = {}  # Used as an ordered set: set order depends on hash randomisation
+
+    for _ in range(candidates):
+        shift_idx = rng.randrange(tables.num_shifts)
+        if rng.random() < 0.5:
+            eligible = tables.eligible_nurses[shift_idx]
+            nurse_idx = rng.choice(eligible) if eligible else rng.randrange(tables.num_nurses)
+            if nurse_idx != evaluator.genome[shift_idx]:
+                moves[("reassign", shift_idx, nurse_idx)] = None
+        else:
+            other = rng.randrange(tables.num_shifts)
+            if evaluator.genome[shift_idx] != evaluator.genome[other]:
+                moves[("swap", min(shift_idx, other), max(shift_idx, other))] = None
+
+    return list(moves)
+
+
+def move_delta(evaluator, move):
+    """Scores a move incrementally without applying it."""
+    kind, a, b = move
+    return evaluator.swap_delta(a, b) if kind == "swap" else evaluator.reassign_delta(a, b)
+
+
+def apply_move(evaluator, move):
+    """Applies a move and returns the new fitness."""
+    kind, a, b = move
+    return evaluator.swap(a, b) if kind == "swap" else evaluator.reassign(a, b)
+
+
+def tabu_search(genome, tables, iterations=TABU_ITERATIONS, tenure=TABU_TENURE,
+                candidates=CANDIDATES_PER_ITERATION, time_budget=None, rng=None):
+    """
+    Improves a genome with tabu search over sampled reassign and swap neighbourhoods.
+
+    Each iteration takes the best non-tabu move, even if it makes the schedule worse,
+    so the search can leave local optima. Giving a shift back to a nurse who just
+    lost it is tabu for `tenure` iterations, unless the move would beat the best
+    fitness found so far (aspiration). With tenure=0 this is steepest descent.
+    :param genome: Starting genome (not modified).
+    :param time_budget: Optional wall-clock limit in seconds.
+    :return: (best genome, best fitness).
+    """
+    rng = rng or random.Random()
+    evaluator = IncrementalEvaluator(genome[:], tables)
+
+    best_genome = evaluator.genome[:]
+    best_fitness = evaluator.score
+    tabu_until = {}  # (shift_idx, nurse_idx) -> iteration when it stops being tabu
+    stagnant = 0
+    start = time.perf_counter()
+
+    for iteration in range(iterations):
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            break
+
+        current_fitness = evaluator.score
+        chosen_move, chosen_delta = None, None
+        for move in sample_neighbourhood(evaluator, rng, candidates):
+            delta = move_delta(evaluator, move)
+            if chosen_delta is not None and delta <= chosen_delta:
+                continue
+
+            # A move is tabu if it hands a shift back to a nurse that recently lost it
+            kind, a, b = move
+            if kind == "swap":
+                arrivals = ((a, evaluator.genome[b]), (b, evaluator.genome[a]))
+            else:
+                arrivals = ((a, b),)
+            is_tabu = any(tabu_until.get(pair, -1) > iteration for pair in arrivals)
+
+            if is_tabu and current_fitness + delta <= best_fitness:
+                continue  # Tabu and no aspiration
+            chosen_move, chosen_delta = move, delta
+
+        if chosen_move is None or (tenure == 0 and chosen_delta <= 0):
+            break  # Nothing allowed, or steepest descent reached a local optimum
+
+        # Record the departures as tabu before applying the move
+        kind, a, b = chosen_move
+        departures = [(a, evaluator.genome[a])] + ([(b, evaluator.genome[b])] if kind == "swap" else [])
+        for pair in departures:
+            tabu_until[pair] = iteration + tenure
+
+        fitness = apply_move(evaluator, chosen_move)
+        if fitness > best_fitness:
+            best_fitness = fitness
+            best_genome = evaluator.genome[:]
+            stagnant = 0
+        else:
+            stagnant += 1
+            if stagnant >= STAGNANT_ITERATIONS:
+                break
+
+    shared_fitness_cache.put(best_genome, tables, best_fitness)
+    return best_genome, best_fitness
+
+
+def polish_schedule(schedule, iterations=TABU_ITERATIONS, time_budget=None, seed=None):
+    """
+    Runs tabu search on any Schedule (e.g. from genetic_algorithm() or the greedy
+    assignments) and returns an improved Schedule.
+    """
+    tables = load_tables()
+    genome = genome_from_assignments(schedule.assignments, tables)
+    best_genome, best_fitness = tabu_search(genome, tables, iterations=iterations,
+                                            time_budget=time_budget, rng=random.Random(seed))
+    print(f"✅ Local search finished with fitness {best_fitness}")
+    return genome_to_schedule(best_genome, tables)
+
+
+if __name__ == "__main__":
+    from scheduling_algorithms.greedy_initialization import greedy_initialization
+    from models.schedule import Schedule
+
+    tables = load_tables()
+    schedule = Schedule()
+    schedule.assignments = greedy_initialization(list(tables.nurses), list(tables.shifts))
+    polish_schedule(schedule).display_schedule()
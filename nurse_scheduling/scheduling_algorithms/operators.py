@@ -0,0 +1,105 @@
+# scheduling_algorithms/operators.py
+
+import random
+import sys
+import os
+from collections import defaultdict
+from functools import lru_cache
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from constraints.compiled_model import NurseTimeline, build_timelines
+from models.genome import UNASSIGNED
+from scheduling_algorithms.constructive_heuristic import choose_nurse
+
+MUTATION_SHARE = 0.05  # Share of shifts eligible_mutation tries to reassign
+
+
+@lru_cache(maxsize=8)
+def week_blocks(tables):
+    """The shift indices of each ISO week, in week order."""
+    weeks = defaultdict(list)
+    for shift_idx, week in enumerate(tables.shift_weeks):
+        weeks[week].append(shift_idx)
+    return tuple(tuple(weeks[week]) for week in sorted(weeks))
+
+
+def uniform_crossover(parent1, parent2, tables, rng=random):
+    """Takes each shift's nurse from either parent with equal probability."""
+    child = parent1[:]
+    for shift_idx, nurse_idx in enumerate(parent2):
+        if rng.random() < 0.5:
+            child[shift_idx] = nurse_idx
+    return child
+
+
+def week_block_crossover(parent1, parent2, tables, rng=random):
+    """
+    Takes whole weeks from either parent, so each week's roster (and its
+    hours and rest pattern) is inherited intact.
+    """
+    child = parent1[:]
+    for block in week_blocks(tables):
+        if rng.random() < 0.5:
+            for shift_idx in block:
+                child[shift_idx] = parent2[shift_idx]
+    return child
+
+
+def eligible_mutation(genome, tables, share=MUTATION_SHARE, rng=random, moves=None):
+    """
+    Moves a share of the shifts to other nurses who are available for them and
+    stay within the hours, consecutive-day and rest limits. Shifts with no such
+    nurse keep theirs. Mutates the genome in place and returns it.
+    :param moves: Exact number of shifts to try (default: the share, at least one).
+    """
+    if moves is None:
+        moves = max(1, int(tables.num_shifts * share))
+    timelines = build_timelines(genome, tables)
+    for shift_idx in rng.sample(range(tables.num_shifts), moves):
+        current = genome[shift_idx]
+        candidates = [nurse_idx for nurse_idx in tables.eligible_nurses[shift_idx] if nurse_idx != current]
+        rng.shuffle(candidates)
+        for nurse_idx in candidates:
+            if timelines[nurse_idx].can_insert(shift_idx):
+                if current != UNASSIGNED:
+                    timelines[current].remove(shift_idx)
+                timelines[nurse_idx].add(shift_idx)
+                genome[shift_idx] = nurse_idx
+                break
+    return genome
+
+
+def repair(genome, tables, counts=None):
+    """
+    Makes every shift covered exactly once by a nurse who can take it.
+
+    Shifts are replayed in date order. Each keeps its nurse if they are available
+    and stay within the limits; the rest (and unassigned shifts) are placed with
+    choose_nurse(), most-constrained first. Mutates the genome in place and returns it.
+    :param counts: Optional dict that receives "replaced" (shifts re-placed) and
+                   "beyond_limits" (of those, shifts nobody could take within the limits).
+    """
+    loads = [NurseTimeline(tables) for _ in range(tables.num_nurses)]
+    leftover = []
+
+    for shift_idx in sorted(range(tables.num_shifts), key=lambda i: tables.shift_starts[i]):
+        nurse_idx = genome[shift_idx]
+        eligible = tables.eligible_nurses[shift_idx]
+        if (nurse_idx != UNASSIGNED and (nurse_idx in eligible or not eligible)
+                and loads[nurse_idx].can_insert(shift_idx)):
+            loads[nurse_idx].add(shift_idx)
+        else:
+            leftover.append(shift_idx)
+
+    relaxed = 0
+    for shift_idx in sorted(leftover, key=lambda i: (len(tables.eligible_nurses[i]), tables.shift_days[i])):
+        nurse_idx, within_limits = choose_nurse(shift_idx, loads, tables)
+        relaxed += not within_limits
+        genome[shift_idx] = nurse_idx
+        loads[nurse_idx].add(shift_idx)
+
+    if counts is not None:
+        counts["replaced"] = len(leftover)
+        counts["beyond_limits"] = relaxed
+    return genome
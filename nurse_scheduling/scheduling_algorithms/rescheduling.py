@@ -0,0 +1,273 @@
+# scheduling_algorithms/rescheduling.py
+
+import logging
+import random
+import sys
+import os
+import time
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from constraints.compiled_model import build_timelines
+from evaluation.incremental_fitness import IncrementalEvaluator
+from models.genome import UNASSIGNED, ScheduleTables, empty_genome, genome_from_assignments
+from scheduling_algorithms.constructive_heuristic import least_loaded_nurse
+
+logger = logging.getLogger(__name__)
+
+# Repair Parameters
+REPAIR_TIME_BUDGET = 1.0  # Seconds
+NEIGHBOURHOOD_DAYS = 1  # Days either side of a change that may be re-optimised
+MAX_NEIGHBOURHOOD_DAYS = 7  # Widest the neighbourhood grows if shifts are still uncovered
+# Fitness a move must gain per published assignment it changes. Above the 15-point
+# preference reward (the largest soft gain of one move; workload hours only move
+# between nurses), so only coverage and constraint fixes justify a change.
+CHANGE_PENALTY = 16
+STAGNANT_TRIES_PER_SHIFT = 20  # Stop once this many tries per free shift find nothing better
+
+
+class RosterChanges:
+    """
+    Last-minute changes to a published schedule: absences, new shifts and
+    cancelled shifts.
+    """
+
+    def __init__(self):
+        self.absences = {}  # nurse_id -> set of "YYYY-MM-DD" dates
+        self.added_shifts = []  # Shift objects
+        self.removed_shift_ids = set()
+
+    def nurse_unavailable(self, nurse_id, dates):
+        """Marks a nurse as unable to work on the given dates."""
+        self.absences.setdefault(nurse_id, set()).update(dates)
+        return self
+
+    def add_shift(self, shift):
+        """Adds a new (unassigned) shift to the roster."""
+        self.added_shifts.append(shift)
+        return self
+
+    def remove_shift(self, shift_id):
+        """Cancels a shift."""
+        self.removed_shift_ids.add(shift_id)
+        return self
+
+    def __repr__(self):
+        return (f"RosterChanges with {sum(len(d) for d in self.absences.values())} absent days, "
+                f"{len(self.added_shifts)} added and {len(self.removed_shift_ids)} removed shifts")
+
+
+def schedule_tables(schedule):
+    """Builds ScheduleTables from the nurses and shifts of a Schedule object."""
+    nurses = [
+        {"nurse_id": n.nurse_id, "name": n.name, "age": n.age,
+         "availability": n.availability, "preferred_shifts": n.preferred_shifts}
+        for n in schedule.nurses
+    ]
+    shifts = [
+        {"shift_id": s.shift_id, "date": s.date, "shift_type": s.shift_type, "ward": s.ward}
+        for s in schedule.shifts
+    ]
+    return ScheduleTables(nurses, shifts)
+
+
+def apply_changes(schedule, changes):
+    """
+    Applies the changes to the schedule with Schedule.add_shift/remove_shift and
+    takes absent nurses off their shifts on the days they are away.
+    :return: The dates the changes touch.
+    """
+    touched_dates = set()
+
+    for shift in [s for s in schedule.shifts if s.shift_id in changes.removed_shift_ids]:
+        schedule.remove_shift(shift)
+        touched_dates.add(shift.date)
+
+    for shift in changes.added_shifts:
+        shift.assigned_nurse = None
+        schedule.add_shift(shift)
+        touched_dates.add(shift.date)
+
+    for nurse_id, dates in changes.absences.items():
+        assigned = schedule.assignments.get(nurse_id, [])
+        for shift in [s for s in assigned if s.date in dates]:
+            assigned.remove(shift)
+            shift.assigned_nurse = None
+            touched_dates.add(shift.date)
+
+    return touched_dates
+
+
+def neighbourhood(tables, touched_days, radius):
+    """Returns the indices of the shifts within `radius` days of a touched day."""
+    return [
+        shift_idx for shift_idx, day in enumerate(tables.shift_days)
+        if any(abs(day - touched) <= radius for touched in touched_days)
+    ]
+
+
+def repair_genome(genome, tables, free_shifts, blocked, published, time_budget, rng):
+    """
+    Re-optimises the free shifts of a genome in place, leaving all other shifts as they are.
+
+    Uncovered shifts are first given to the least-loaded nurse who can take them
+    within the limits, then a hill climb over reassign and swap moves improves the
+    fitness minus CHANGE_PENALTY for every shift whose nurse differs from `published`.
+    :param blocked: Set of (nurse index, day ordinal) pairs the nurse cannot work.
+    :return: The number of moves applied.
+    """
+    def allowed(nurse_idx, shift_idx):
+        return (nurse_idx, tables.shift_days[shift_idx]) not in blocked
+
+    def change_cost(shift_idx, nurse_idx):
+        return CHANGE_PENALTY if published[shift_idx] not in (UNASSIGNED, nurse_idx) else 0
+
+    # Cover the open shifts, most constrained first
+    timelines = build_timelines(genome, tables)
+    open_shifts = sorted((s for s in free_shifts if genome[s] == UNASSIGNED),
+                         key=lambda s: (len(tables.eligible_nurses[s]), tables.shift_days[s]))
+    for shift_idx in open_shifts:
+        candidates = [n for n in tables.eligible_nurses[shift_idx] if allowed(n, shift_idx)]
+        nurse_idx = least_loaded_nurse(candidates, timelines, shift_idx, tables)
+        if nurse_idx is None:
+            nurse_idx = least_loaded_nurse([n for n in range(tables.num_nurses) if allowed(n, shift_idx)],
+                                           timelines, shift_idx, tables)
+        if nurse_idx is not None:
+            genome[shift_idx] = nurse_idx
+            timelines[nurse_idx].add(shift_idx)
+
+    # Hill climb inside the neighbourhood
+    evaluator = IncrementalEvaluator(genome, tables)
+    moves = 0
+    start = time.perf_counter()
+    iteration = 0
+    since_move = 0
+    stagnant_limit = STAGNANT_TRIES_PER_SHIFT * len(free_shifts)
+    while free_shifts and since_move < stagnant_limit:
+        if iteration % 256 == 0 and time.perf_counter() - start >= time_budget:
+            break
+        iteration += 1
+        since_move += 1
+        shift_idx = rng.choice(free_shifts)
+        current = genome[shift_idx]
+
+        if rng.random() < 0.5:
+            eligible = tables.eligible_nurses[shift_idx] or range(tables.num_nurses)
+            nurse_idx = rng.choice(eligible)
+            if nurse_idx == current or not allowed(nurse_idx, shift_idx):
+                continue
+            gain = (evaluator.reassign_delta(shift_idx, nurse_idx)
+                    - change_cost(shift_idx, nurse_idx) + change_cost(shift_idx, current))
+            if gain > 0:
+                evaluator.reassign(shift_idx, nurse_idx)
+                moves += 1
+                since_move = 0
+        else:
+            other = rng.choice(free_shifts)
+            other_nurse = genome[other]
+            if other_nurse == current:
+                continue
+            if (other_nurse != UNASSIGNED and not allowed(other_nurse, shift_idx)) or \
+                    (current != UNASSIGNED and not allowed(current, other)):
+                continue
+            gain = (evaluator.swap_delta(shift_idx, other)
+                    - change_cost(shift_idx, other_nurse) - change_cost(other, current)
+                    + change_cost(shift_idx, current) + change_cost(other, other_nurse))
+            if gain > 0:
+                evaluator.swap(shift_idx, other)
+                moves += 1
+                since_move = 0
+
+    logger.debug("Repair tried %d moves on %d free shifts and applied %d", iteration, len(free_shifts), moves)
+    return moves
+
+
+def reschedule(schedule, changes, time_budget=REPAIR_TIME_BUDGET, radius=NEIGHBOURHOOD_DAYS, seed=None):
+    """
+    Repairs a published schedule after last-minute changes instead of solving it again.
+
+    Only shifts within `radius` days of a change are re-optimised; everything else
+    stays frozen. If shifts are still uncovered, the neighbourhood is widened
+    (up to MAX_NEIGHBOURHOOD_DAYS) and the repair runs again. Moves must gain
+    more than CHANGE_PENALTY per changed assignment, so the roster changes as
+    little as possible. The schedule is updated in place.
+    :param schedule: A Schedule whose assignments hold Shift objects from schedule.shifts.
+    :param changes: A RosterChanges.
+    :param time_budget: Wall-clock limit in seconds for the whole repair.
+    :return: A list of (shift_id, old nurse_id, new nurse_id) for every shift whose nurse changed.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+
+    # The published nurse of every shift, taken before absent nurses are removed
+    published_nurses = {
+        shift.shift_id: nurse_id for nurse_id, shifts in schedule.assignments.items() for shift in shifts
+    }
+
+    touched_dates = apply_changes(schedule, changes)
+    tables = schedule_tables(schedule)
+    genome = genome_from_assignments(schedule.assignments, tables)
+    before_repair = genome[:]
+    published = empty_genome(tables)
+    for shift_idx, shift_id in enumerate(tables.shift_ids):
+        nurse_idx = tables.nurse_index.get(published_nurses.get(shift_id))
+        if nurse_idx is not None:
+            published[shift_idx] = nurse_idx
+
+    blocked = set()
+    for nurse_id, dates in changes.absences.items():
+        nurse_idx = tables.nurse_index.get(nurse_id)
+        if nurse_idx is not None:
+            blocked.update((nurse_idx, datetime.strptime(date, "%Y-%m-%d").toordinal()) for date in dates)
+
+    touched_days = {datetime.strptime(date, "%Y-%m-%d").toordinal() for date in touched_dates}
+    while True:
+        free_shifts = neighbourhood(tables, touched_days, radius)
+        remaining = time_budget - (time.perf_counter() - start)
+        repair_genome(genome, tables, free_shifts, blocked, published, max(0.0, remaining) / 2, rng)
+
+        uncovered = genome.count(UNASSIGNED)
+        if not uncovered or radius >= MAX_NEIGHBOURHOOD_DAYS or time.perf_counter() - start >= time_budget:
+            break
+        radius = min(radius * 2, MAX_NEIGHBOURHOOD_DAYS)
+        logger.debug("%d shifts still uncovered, widening the neighbourhood to %d days", uncovered, radius)
+
+    def nurse_id(nurse_idx):
+        return tables.nurse_ids[nurse_idx] if nurse_idx != UNASSIGNED else None
+
+    # Write the repair back onto the schedule's own Shift objects, and report
+    # every change against the published roster (so an absent nurse is named)
+    changed = []
+    for shift_idx, shift in enumerate(schedule.shifts):
+        new_nurse = nurse_id(genome[shift_idx])
+        if genome[shift_idx] != before_repair[shift_idx]:
+            old_nurse = nurse_id(before_repair[shift_idx])
+            if old_nurse is not None:
+                schedule.assignments[old_nurse].remove(shift)
+            if new_nurse is not None:
+                schedule.assignments.setdefault(new_nurse, []).append(shift)
+            shift.assigned_nurse = new_nurse
+        if genome[shift_idx] != published[shift_idx]:
+            changed.append((shift.shift_id, nurse_id(published[shift_idx]), new_nurse))
+
+    logger.info("Rescheduled in %.2fs: %d assignments changed, %d shifts uncovered",
+                time.perf_counter() - start, len(changed), genome.count(UNASSIGNED))
+    return changed
+
+
+if __name__ == "__main__":
+    from models.genome import load_tables, genome_to_schedule
+    from scheduling_algorithms.constructive_heuristic import constructive_initialization
+
+    logging.basicConfig(level=logging.INFO)
+    tables = load_tables()
+    schedule = genome_to_schedule(constructive_initialization(tables), tables)
+
+    # A nurse calls in sick for their first two shifts
+    nurse_id = next(nurse_id for nurse_id, shifts in schedule.assignments.items() if shifts)
+    sick_dates = {shift.date for shift in schedule.assignments[nurse_id][:2]}
+    changes = RosterChanges().nurse_unavailable(nurse_id, sick_dates)
+
+    for shift_id, old_nurse, new_nurse in reschedule(schedule, changes):
+        print(f"Shift {shift_id}: nurse {old_nurse} -> nurse {new_nurse}")
@@ -1 +1,179 @@
- # Main entry point of the program
+# scheduling_algorithms/simulated_annealing.py
+
+import math
+import random
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scheduling_algorithms.constructive_heuristic import constructive_initialization
+from scheduling_algorithms.warm_start import matching_initialization
+from evaluation.incremental_fitness import IncrementalEvaluator
+from evaluation.fitness_cache import shared_fitness_cache
+from models.genome import load_tables, genome_to_schedule
+
+# Simulated Annealing Parameters
+TIME_BUDGET = 10.0  # Seconds
+INITIAL_TEMPERATURE = 50.0
+MIN_TEMPERATURE = 0.01
+COOLING_RATE = 0.9995  # Geometric cooling factor per move
+ADAPTIVE_WINDOW = 500  # Moves between adaptive temperature updates
+REHEAT_AFTER = 20000  # Moves without a new best before reheating
+REHEAT_FACTOR = 0.5  # Reheat to this fraction of INITIAL_TEMPERATURE
+COOLING_SCHEDULES = ("geometric", "adaptive")
+NEIGHBOURHOODS = {"swap": 0.4, "move": 0.2, "reassign": 0.4}  # Move type -> probability
+
+
+def propose_move(evaluator, rng, neighbourhoods):
+    """
+    Picks a random move from the given neighbourhoods.
+    :return: (kind, shift_idx, other) where other is a shift for "swap" and a nurse otherwise,
+             or None if the chosen move would do nothing.
+    """
+    tables = evaluator.tables
+    kind = rng.choices(list(neighbourhoods), weights=list(neighbourhoods.values()))[0]
+
+    if kind == "swap":
+        shift_a = rng.randrange(tables.num_shifts)
+        shift_b = rng.randrange(tables.num_shifts)
+        if evaluator.genome[shift_a] == evaluator.genome[shift_b]:
+            return None
+        return kind, shift_a, shift_b
+
+    if kind == "move":
+        # Take one shift from a random working nurse and give it to any other nurse
+        nurse_idx = rng.randrange(tables.num_nurses)
+        if not evaluator.nurse_shifts[nurse_idx]:
+            return None
+        shift_idx = rng.choice(evaluator.nurse_shifts[nurse_idx])
+        target = rng.randrange(tables.num_nurses)
+    else:
+        # Give a random shift to a nurse who is available for it
+        shift_idx = rng.randrange(tables.num_shifts)
+        eligible = tables.eligible_nurses[shift_idx]
+        if not eligible:
+            return None
+        target = rng.choice(eligible)
+
+    if evaluator.genome[shift_idx] == target:
+        return None
+    return kind, shift_idx, target
+
+
+def anneal(genome, tables, time_budget=TIME_BUDGET, cooling="geometric", max_iterations=None,
+           initial_temperature=INITIAL_TEMPERATURE, neighbourhoods=None, rng=None, verbose=True):
+    """
+    Improves a genome by simulated annealing, scoring each move incrementally.
+    :param genome: Starting genome (not modified).
+    :param time_budget: Wall-clock limit in seconds (None for no limit).
+    :param cooling: "geometric" or "adaptive" (temperature steered by the acceptance rate).
+    :param max_iterations: Optional move limit, for reproducible runs.
+    :return: (best genome, best fitness).
+    """
+    if cooling not in COOLING_SCHEDULES:
+        raise ValueError(f"Unknown cooling schedule '{cooling}'. Choose from {COOLING_SCHEDULES}.")
+    if time_budget is None and max_iterations is None:
+        raise ValueError("Give a time_budget or max_iterations so the search can stop.")
+
+    rng = rng or random.Random()
+    neighbourhoods = neighbourhoods or NEIGHBOURHOODS
+    evaluator = IncrementalEvaluator(genome[:], tables)
+
+    current_fitness = evaluator.score
+    best_genome = evaluator.genome[:]
+    best_fitness = current_fitness
+
+    temperature = initial_temperature
+    start = time.perf_counter()
+    iteration = 0
+    since_best = 0
+    accepted_in_window = 0
+    reheats = 0
+
+    while max_iterations is None or iteration < max_iterations:
+        # Checking the clock on every move would cost more than the move itself
+        if time_budget is not None and iteration % 256 == 0 and time.perf_counter() - start >= time_budget:
+            break
+        iteration += 1
+        since_best += 1
+
+        move = propose_move(evaluator, rng, neighbourhoods)
+        if move is not None:
+            kind, shift_idx, other = move
+            if kind == "swap":
+                delta = evaluator.swap_delta(shift_idx, other)
+            else:
+                delta = evaluator.reassign_delta(shift_idx, other)
+
+            # Fitness is maximised: always accept improvements, sometimes accept worse moves
+            if delta >= 0 or rng.random() < math.exp(delta / max(temperature, 1e-12)):
+                if kind == "swap":
+                    current_fitness = evaluator.swap(shift_idx, other)
+                else:
+                    current_fitness = evaluator.reassign(shift_idx, other)
+                accepted_in_window += 1
+
+                if current_fitness > best_fitness:
+                    best_fitness = current_fitness
+                    best_genome = evaluator.genome[:]
+                    since_best = 0
+
+        # Cooling
+        if cooling == "geometric":
+            temperature = max(MIN_TEMPERATURE, temperature * COOLING_RATE)
+        elif iteration % ADAPTIVE_WINDOW == 0:
+            if time_budget is not None:
+                progress = min(1.0, (time.perf_counter() - start) / time_budget)
+            else:
+                progress = iteration / max_iterations
+            target_rate = 0.5 * (1 - progress) + 0.01  # Accept less and less as the run goes on
+            if accepted_in_window / ADAPTIVE_WINDOW > target_rate:
+                temperature = max(MIN_TEMPERATURE, temperature * 0.9)
+            else:
+                temperature = min(initial_temperature, temperature / 0.95)  # Never hotter than the start
+            accepted_in_window = 0
+
+        # Reheat when stuck
+        if since_best >= REHEAT_AFTER:
+            temperature = max(temperature, initial_temperature * REHEAT_FACTOR)
+            since_best = 0
+            reheats += 1
+
+    if verbose:
+        elapsed = time.perf_counter() - start
+        print(f"✅ Simulated annealing: {iteration} moves in {elapsed:.1f}s "
+              f"({iteration / max(elapsed, 1e-9):.0f} moves/s, {reheats} reheats), best fitness {best_fitness}")
+
+    shared_fitness_cache.put(best_genome, tables, best_fitness)
+    return best_genome, best_fitness
+
+
+def simulated_annealing(time_budget=TIME_BUDGET, cooling="geometric", max_iterations=None, seed=None,
+                        seeding="constructive"):
+    """
+    Runs simulated annealing to find the best nurse schedule.
+    Takes and returns the same things as genetic_algorithm().
+    :param time_budget: Wall-clock limit in seconds.
+    :param cooling: "geometric" or "adaptive".
+    :param max_iterations: Optional move limit.
+    :param seed: Optional random seed.
+    :param seeding: Start from the "constructive" heuristic or the "matching" warm start.
+    :return: The best Schedule found.
+    """
+    print("🔥 Running Simulated Annealing...")
+
+    rng = random.Random(seed)
+    tables = load_tables()
+    genome = matching_initialization(tables) if seeding == "matching" else constructive_initialization(tables)
+
+    best_genome, _ = anneal(genome, tables, time_budget=time_budget, cooling=cooling,
+                            max_iterations=max_iterations, rng=rng)
+    return genome_to_schedule(best_genome, tables)
+
+
+if __name__ == "__main__":
+    final_schedule = simulated_annealing()
+    print("✅ Simulated Annealing Finished!")
+    final_schedule.display_schedule()
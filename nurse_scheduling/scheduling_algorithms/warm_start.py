@@ -0,0 +1,232 @@
+# scheduling_algorithms/warm_start.py
+
+import logging
+import random
+import sys
+import os
+from array import array
+from collections import defaultdict, deque
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    np = linear_sum_assignment = None
+
+from constraints.constraints import MAX_HOURS_PER_WEEK
+from models.genome import UNASSIGNED, load_tables, genome_to_schedule
+from scheduling_algorithms.operators import eligible_mutation, repair
+
+logger = logging.getLogger(__name__)
+
+PREFERRED_SHIFT_REWARD = 15  # Fitness reward per preferred shift, as in score_nurse
+PERTURBATION_RATE = 0.1  # Share of shifts reassigned in each perturbed variant
+SOLVERS = ("auto", "scipy", "python")
+
+
+def week_capacity(tables, shift_indices):
+    """
+    The most shifts one nurse can work in a week without breaking the weekly
+    hours limit, counting every shift at the shortest length that week. Any
+    roster within the limit fits, so the relaxation never cuts off a feasible one.
+    """
+    shortest = min(tables.shift_hours[shift_idx] for shift_idx in shift_indices) or 1
+    return max(1, MAX_HOURS_PER_WEEK // shortest)
+
+
+def _shift_costs(tables, shift_indices, preference_only):
+    """
+    Edge costs of the relaxed assignment, one dict of nurse -> cost per shift.
+
+    Covering a shift is worth more than every preference in the week put
+    together, so coverage comes first, then preferences. With
+    preference_only, the edges are every nurse who prefers the shift type,
+    available or not, since score_nurse rewards both.
+    """
+    if preference_only:
+        return [
+            {nurse_idx: -1 for nurse_idx in range(tables.num_nurses)
+             if tables.shift_types[shift_idx] in tables.preferred_types[nurse_idx]}
+            for shift_idx in shift_indices
+        ]
+
+    uncovered = len(shift_indices) + 2
+    costs = []
+    for shift_idx in shift_indices:
+        shift_type = tables.shift_types[shift_idx]
+        costs.append({
+            nurse_idx: -(shift_type in tables.preferred_types[nurse_idx]) - uncovered
+            for nurse_idx in tables.eligible_nurses[shift_idx]
+        })
+    return costs
+
+
+def _slot_cost(slot, capacity, num_shifts):
+    """
+    Cost of a nurse's slot-th shift in a week. It grows with each shift, which
+    spreads the load, but all of them together stay below one preference.
+    """
+    return slot / (capacity * num_shifts + 1)
+
+
+def _match_scipy(costs, num_nurses, capacity):
+    """Solves the week as a rectangular assignment over nurse slots with SciPy."""
+    num_shifts = len(costs)
+    slots = num_nurses * capacity
+    # Matched cells are negative, the per-shift "leave uncovered" column is 0 and non-edges are worse
+    matrix = np.ones((num_shifts, slots + num_shifts))
+    matrix[:, slots:] = np.where(np.eye(num_shifts, dtype=bool), 0.0, 1.0)
+    slot_costs = np.array([_slot_cost(slot, capacity, num_shifts) for slot in range(capacity)])
+    for row, edges in enumerate(costs):
+        for nurse_idx, cost in edges.items():
+            matrix[row, nurse_idx * capacity:(nurse_idx + 1) * capacity] = cost + slot_costs
+
+    rows, columns = linear_sum_assignment(matrix)
+    return {int(row): int(column) // capacity for row, column in zip(rows, columns) if column < slots}
+
+
+def _match_python(costs, num_nurses, capacity):
+    """
+    Solves the week as a min-cost flow (source -> shift -> nurse -> sink, one
+    sink edge per nurse slot) by successive shortest paths.
+    """
+    num_shifts = len(costs)
+    source, sink = num_shifts + num_nurses, num_shifts + num_nurses + 1
+    graph = [[] for _ in range(sink + 1)]  # node -> [edge index]
+    heads, capacities, edge_costs = [], [], []
+
+    def add_edge(tail, head, cost):
+        for node, other, cap, sign in ((tail, head, 1, 1), (head, tail, 0, -1)):
+            graph[node].append(len(heads))
+            heads.append(other)
+            capacities.append(cap)
+            edge_costs.append(sign * cost)
+
+    for row, edges in enumerate(costs):
+        add_edge(source, row, 0)
+        for nurse_idx, cost in edges.items():
+            add_edge(row, num_shifts + nurse_idx, cost)
+    used_nurses = {nurse_idx for edges in costs for nurse_idx in edges}
+    for nurse_idx in used_nurses:
+        for slot in range(capacity):
+            add_edge(num_shifts + nurse_idx, sink, _slot_cost(slot, capacity, num_shifts))
+
+    while True:
+        # Bellman-Ford (queue based), since shift -> nurse edges are negative
+        distance = [float("inf")] * (sink + 1)
+        via = [None] * (sink + 1)
+        distance[source] = 0
+        queue, queued = deque([source]), {source}
+        while queue:
+            node = queue.popleft()
+            queued.discard(node)
+            for edge in graph[node]:
+                head = heads[edge]
+                if capacities[edge] and distance[node] + edge_costs[edge] < distance[head] - 1e-12:
+                    distance[head] = distance[node] + edge_costs[edge]
+                    via[head] = edge
+                    if head not in queued:
+                        queue.append(head)
+                        queued.add(head)
+        if distance[sink] >= 0:
+            break  # No path lowers the cost: leaving the rest uncovered is optimal
+        node = sink
+        while node != source:
+            edge = via[node]
+            capacities[edge] -= 1
+            capacities[edge ^ 1] += 1
+            node = heads[edge ^ 1]
+
+    matching = {}
+    for row in range(num_shifts):
+        for edge in graph[row]:
+            if edge % 2 == 0 and not capacities[edge]:  # Even edges are the forward shift -> nurse ones
+                matching[row] = heads[edge] - num_shifts
+    return matching
+
+
+def relaxed_assignment(tables, preference_only=False, solver="auto"):
+    """
+    Solves the relaxed shift-to-nurse assignment: every shift goes to at most
+    one available nurse and every nurse gets at most week_capacity() shifts
+    per week. The consecutive-day and rest limits are dropped. Weeks do not
+    share nurse capacity, so each week is solved on its own.
+    :param preference_only: Maximise only the number of preferred assignments, allowing
+                            any nurse who prefers the shift type (see _shift_costs).
+    :param solver: "scipy", "python" (min-cost flow) or "auto" (SciPy if installed).
+    :return: (nurse index or UNASSIGNED per shift, number of preferred assignments)
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver '{solver}'. Choose from {SOLVERS}.")
+    if solver == "scipy" and linear_sum_assignment is None:
+        raise ImportError("The SciPy solver needs NumPy and SciPy. Install them with 'pip install numpy scipy'.")
+    match = _match_scipy if solver == "scipy" or (solver == "auto" and linear_sum_assignment is not None) else _match_python
+
+    weeks = defaultdict(list)
+    for shift_idx, week in enumerate(tables.shift_weeks):
+        weeks[week].append(shift_idx)
+
+    assignment = [UNASSIGNED] * tables.num_shifts
+    preferred = 0
+    for shift_indices in weeks.values():
+        costs = _shift_costs(tables, shift_indices, preference_only)
+        for row, nurse_idx in match(costs, tables.num_nurses, week_capacity(tables, shift_indices)).items():
+            shift_idx = shift_indices[row]
+            assignment[shift_idx] = nurse_idx
+            preferred += tables.shift_types[shift_idx] in tables.preferred_types[nurse_idx]
+    return assignment, preferred
+
+
+def preference_bound(tables, solver="auto"):
+    """
+    Upper bound on the preference reward (as scored by score_nurse) of any
+    roster that keeps the weekly hours limit: the most preferred assignments
+    the relaxation allows, times PREFERRED_SHIFT_REWARD.
+    """
+    _, preferred = relaxed_assignment(tables, preference_only=True, solver=solver)
+    bound = preferred * PREFERRED_SHIFT_REWARD
+    logger.info("Preference reward bound: %d (%d preferred assignments)", bound, preferred)
+    return bound
+
+
+def matching_initialization(tables, solver="auto"):
+    """
+    Builds a genome from the relaxed assignment. Matched shifts are kept while
+    the nurse stays within the consecutive-day and rest limits; repair() places the rest.
+    """
+    assignment, preferred = relaxed_assignment(tables, solver=solver)
+    counts = {}
+    genome = repair(array("i", assignment), tables, counts)
+
+    logger.info("Matching warm start: %d preferred assignments, %d shifts re-placed, %d beyond the limits",
+                preferred, counts["replaced"], counts["beyond_limits"])
+    return genome
+
+
+def perturb(genome, tables, rate=PERTURBATION_RATE, rng=random):
+    """
+    Returns a copy of the genome with a share of its shifts moved to other
+    available nurses who stay within the limits (see eligible_mutation).
+    """
+    return eligible_mutation(genome[:], tables, rng=rng, moves=int(tables.num_shifts * rate))
+
+
+def warm_start_population(tables, population_size, rate=PERTURBATION_RATE, rng=random, solver="auto"):
+    """The matching genome followed by population_size - 1 perturbed variants of it."""
+    genome = matching_initialization(tables, solver)
+    return [genome] + [perturb(genome, tables, rate, rng) for _ in range(population_size - 1)]
+
+
+if __name__ == "__main__":
+    from evaluation.fitness_function import evaluate_genome
+    from scheduling_algorithms.constructive_heuristic import constructive_initialization
+
+    logging.basicConfig(level=logging.INFO)
+    tables = load_tables()
+    genome = matching_initialization(tables)
+    print(f"Constructive fitness: {evaluate_genome(constructive_initialization(tables), tables)}")
+    print(f"Matching fitness: {evaluate_genome(genome, tables)}")
+    print(f"Preference reward bound: {preference_bound(tables)}")
+    genome_to_schedule(genome, tables).display_schedule()